@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+TurboConvert — Génération des blocs dérivés de tools.json
+=========================================================
+Usage : python3 build-site.py [dossier/]
+
+tools.json est la source de vérité des outils (slug, nom, formats, limite,
+moteurs, priorité sitemap). Ce script réécrit les blocs délimités par
+<!-- build:NOM --> … <!-- /build:NOM --> :
+  - <outil>.html  : schema ld+json inline (HowTo, BreadcrumbList…)
+  - <outil>.html  : balise du gouverneur mémoire (limite, heap moteur, facteur)
+  - index.html    : table TOOL_ENGINES (prefetch moteur depuis le Hero)
+  - sitemap.xml   : URLs des pages outils
+  - llms.txt      : liste des outils par catégorie
+Jouer AVANT inject-schema.py.
+
+Exit code 0 = OK, 1 = marqueur manquant.
+"""
+
+import json, re, sys
+from pathlib import Path
+
+MANIFEST = 'tools.json'
+SITE_URL = 'https://turboconvert.io'
+
+
+def load_manifest(base='.'):
+    """Charge tools.json. Retourne le dict brut."""
+    with open(Path(base) / MANIFEST, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def tool_engine_urls(manifest, tool):
+    """Liste ordonnée et dédupliquée des assets moteur d'un outil."""
+    urls = []
+    for engine in tool['engines']:
+        for url in manifest['engines'][engine]:
+            if url not in urls:
+                urls.append(url)
+    return urls
+
+
+def block_pattern(name):
+    return re.compile(
+        rf'(<!-- build:{re.escape(name)} -->\n)[\s\S]*?([ \t]*<!-- /build:{re.escape(name)} -->)'
+    )
+
+
+def replace_block(content, name, body):
+    """Remplace le contenu entre <!-- build:name --> et <!-- /build:name -->.
+    Retourne None si les marqueurs sont absents."""
+    pattern = block_pattern(name)
+    if not pattern.search(content):
+        return None
+    return pattern.sub(lambda m: m.group(1) + body + m.group(2), content, count=1)
+
+
+# ══════════════════════════════════════════════════════════════════════
+# BLOCS
+# ══════════════════════════════════════════════════════════════════════
+
+def render_schema(manifest, tool, content):
+    """<outil>.html — @graph ld+json. Les types déjà écrits à la main dans la
+    page (WebApplication, FAQPage spécifiques) ne sont pas dupliqués."""
+    slug, name, inp, out = tool['slug'], tool['name'], tool['inp'], tool['out']
+    url = f'{SITE_URL}/{slug}'
+    manual = block_pattern('schema').sub('', content)
+    manual = ' '.join(re.findall(r'<script type="application/ld\+json">[\s\S]*?</script>', manual))
+
+    graph = [
+        {'@type': 'WebApplication', '@id': f'{url}#app',
+         'name': name, 'description': tool['desc'], 'url': url,
+         'applicationCategory': 'UtilitiesApplication', 'operatingSystem': 'Any',
+         'offers': {'@type': 'Offer', 'price': '0', 'priceCurrency': 'USD',
+                    'availability': 'https://schema.org/InStock'},
+         'featureList': [f'Free {inp} to {out} conversion', 'No signup required',
+                         'SSL encrypted', 'Files deleted after processing'],
+         'publisher': {'@type': 'Organization', 'name': 'TurboConvert', 'url': SITE_URL}},
+        {'@type': 'HowTo', 'name': f'How to convert {inp} to {out} online for free',
+         'description': f'Convert {inp} to {out} in 3 steps — free, fast, secure.',
+         'totalTime': 'PT10S', 'step': [
+             {'@type': 'HowToStep', 'position': 1, 'name': f'Upload your {inp} file',
+              'text': f'Click Select file or drag and drop your {inp} file.'},
+             {'@type': 'HowToStep', 'position': 2, 'name': f'Convert to {out}',
+              'text': 'Click Convert. Your file is processed instantly.'},
+             {'@type': 'HowToStep', 'position': 3, 'name': f'Download your {out}',
+              'text': 'Click Download to save your converted file.'},
+         ]},
+        {'@type': 'FAQPage', 'mainEntity': [
+            {'@type': 'Question', 'name': f'Is this {inp} to {out} converter free?',
+             'acceptedAnswer': {'@type': 'Answer', 'text': 'Yes, TurboConvert is 100% free. No signup, no credit card, no limits.'}},
+            {'@type': 'Question', 'name': 'Is my file safe?',
+             'acceptedAnswer': {'@type': 'Answer', 'text': 'Yes. SSL encrypted. Files are permanently deleted after 1 hour.'}},
+            {'@type': 'Question', 'name': 'Do I need software?',
+             'acceptedAnswer': {'@type': 'Answer', 'text': 'No. Works in your browser on any device. No installation needed.'}},
+        ]},
+        {'@type': 'BreadcrumbList', 'itemListElement': [
+            {'@type': 'ListItem', 'position': 1, 'name': 'TurboConvert', 'item': SITE_URL},
+            {'@type': 'ListItem', 'position': 2, 'name': name, 'item': url},
+        ]},
+    ]
+    graph = [node for node in graph if f'"{node["@type"]}"' not in manual]
+    schema = {'@context': 'https://schema.org', '@graph': graph}
+    return (
+        '<script type="application/ld+json">\n'
+        f'{json.dumps(schema, indent=2, ensure_ascii=False)}\n'
+        '</script>\n'
+    )
+
+
+def render_governor(manifest, tool, content):
+    """<outil>.html — mem-governor.js configuré par data-* : limite dure,
+    heap de base des moteurs, facteur mémoire × taille d'entrée, moteur WASM."""
+    base_mb = sum(manifest['engine_heap_mb'][e] for e in tool['engines'])
+    wasm = int(any(e in manifest['wasm_engines'] for e in tool['engines']))
+    return (
+        f'<script defer src="/mem-governor.js" data-limit-mb="{tool["size_limit_mb"]}" '
+        f'data-base-mb="{base_mb}" data-factor="{tool["mem_factor"]}" data-wasm="{wasm}"></script>\n'
+    )
+
+
+def render_tool_engines(manifest, content):
+    """index.html — table /slug → assets moteur, lue par le prefetch du Hero."""
+    rows = ',\n'.join(
+        f"  {json.dumps('/' + t['slug'])}: {json.dumps(tool_engine_urls(manifest, t))}"
+        for t in manifest['tools']
+    )
+    return f'<script>\nvar TOOL_ENGINES = {{\n{rows}\n}};\n</script>\n'
+
+
+def render_tool_map(manifest, content):
+    """index.html — détecteur du Hero : extension → outils suggérés (le premier est préchauffé)."""
+    tools = {t['slug']: t for t in manifest['tools']}
+    rows = ',\n'.join(
+        f"  {json.dumps(ext)}: [" + ','.join(
+            json.dumps({'l': tools[s]['short'], 'u': '/' + s, 'i': tools[s]['icon']},
+                       ensure_ascii=False, separators=(',', ':'))
+            for s in slugs) + ']'
+        for ext, slugs in manifest['detector'].items()
+    )
+    return f'<script>\nvar TOOL_MAP = {{\n{rows}\n}};\n</script>\n'
+
+
+def render_sitemap_tools(manifest, content):
+    """sitemap.xml — une <url> par page outil."""
+    return ''.join(
+        f"  <url><loc>{SITE_URL}/{t['slug']}</loc>"
+        f"<lastmod>{t.get('lastmod', manifest['lastmod'])}</lastmod>"
+        f"<changefreq>monthly</changefreq><priority>{t['priority']}</priority></url>\n"
+        for t in manifest['tools']
+    )
+
+
+def render_llms_tools(manifest, content):
+    """llms.txt — outils groupés par catégorie, dans l'ordre du manifeste."""
+    sections = []
+    for cat, title in manifest['categories'].items():
+        lines = [f"- /{t['slug']} — {t['llms']}" for t in manifest['tools'] if t['category'] == cat]
+        sections.append(f'### {title}\n' + '\n'.join(lines) + '\n')
+    return '\n'.join(sections)
+
+
+def blocks(manifest):
+    """(fichier, nom du bloc, rendu, ancre d'insertion si marqueurs absents)."""
+    out = [
+        ('index.html',  'tool-engines',  render_tool_engines,  None),
+        ('index.html',  'tool-map',      render_tool_map,      None),
+        ('sitemap.xml', 'sitemap-tools', render_sitemap_tools, None),
+        ('llms.txt',    'llms-tools',    render_llms_tools,    None),
+    ]
+    for tool in manifest['tools']:
+        render = lambda m, c, tool=tool: render_schema(m, tool, c)
+        out.append((f"{tool['slug']}.html", 'schema', render, '</head>'))
+        render = lambda m, c, tool=tool: render_governor(m, tool, c)
+        out.append((f"{tool['slug']}.html", 'governor', render, '</head>'))
+    return out
+
+
+def build(base='.'):
+    base = Path(base)
+    manifest = load_manifest(base)
+    missing = 0
+    for filename, name, render, anchor in blocks(manifest):
+        path = base / filename
+        content = path.read_text(encoding='utf-8')
+        # Première génération : créer les marqueurs juste avant l'ancre
+        if anchor and not block_pattern(name).search(content) and anchor in content:
+            content = content.replace(
+                anchor, f'<!-- build:{name} -->\n<!-- /build:{name} -->\n{anchor}', 1)
+        new = replace_block(content, name, render(manifest, content))
+        if new is None:
+            print(f'  FAIL [{filename}] marqueur <!-- build:{name} --> absent')
+            missing += 1
+            continue
+        if new != path.read_text(encoding='utf-8'):
+            path.write_text(new, encoding='utf-8')
+            print(f'built: {filename} ({name})')
+        else:
+            print(f'skip: {filename} ({name})')
+    return 1 if missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(build(sys.argv[1] if len(sys.argv) > 1 else '.'))
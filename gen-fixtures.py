@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+TurboConvert — Générateur de fixtures synthétiques à l'échelle
+==============================================================
+Usage : python3 gen-fixtures.py [--only wav,pdf,…] [--force] [sortie/]
+        (défaut : tests/fixtures/generated/)
+
+tests/fixtures/ ne contient que des fichiers jouets (WAV de 8 KB, PDF d'une
+page). Ce script produit des entrées réalistes. Les formats écrits avec la
+stdlib sont octet pour octet identiques d'un run à l'autre (LCG fixe, zip à
+date fixe, zlib déterministe). JPEG et WebP dépendent des libjpeg/libwebp
+embarquées par Pillow : identiques seulement à version de Pillow égale
+(PILLOW_VERSION, épinglée dans .github/workflows/tests.yml) :
+  - wav   : PCM 16 bits stéréo 44,1 kHz — 1, 10 et 100 MB (module wave)
+  - pdf   : 1, 100 et 1000 pages (texte + tableau, flux Flate)
+  - png   : 4000×3000 RGB bruité
+  - jpg   : 4000×3000 (Pillow requis, sinon ignoré)
+  - webp  : 4000×3000 (Pillow + libwebp requis, sinon ignoré)
+  - docx  : 50 pages (sauts de page explicites)
+  - xlsx  : 10 000 lignes × 6 colonnes
+Écrit aussi manifest.json (nom → octets, sha256) lu par tests/bench.js.
+Les fichiers déjà présents ne sont régénérés qu'avec --force.
+"""
+
+import hashlib, io, json, math, struct, sys, wave, zipfile, zlib
+from pathlib import Path
+
+try:
+    import PIL
+    from PIL import Image
+except ImportError:  # optionnel — JPEG / WebP ignorés
+    Image = None
+
+# Version de Pillow des sha256 JPEG/WebP de la baseline du benchmark
+PILLOW_VERSION = '11.0.0'
+
+DEFAULT_OUT = 'tests/fixtures/generated'
+MB = 1024 * 1024
+ZIP_DATE = (2026, 1, 1, 0, 0, 0)
+IMG_W, IMG_H = 4000, 3000
+
+WORDS = (
+    'invoice total amount client order delivery report quarter revenue margin '
+    'budget forecast region product service contract payment balance summary '
+    'account period growth estimate review annual monthly weekly draft final'
+).split()
+
+
+class Lcg:
+    """Générateur congruentiel (constantes Numerical Recipes) — stable entre
+    versions de Python, contrairement à random.Random pour certains appels."""
+
+    def __init__(self, seed):
+        self.state = seed & 0xFFFFFFFF
+
+    def next(self):
+        self.state = (1664525 * self.state + 1013904223) & 0xFFFFFFFF
+        return self.state
+
+    def byte(self):
+        return self.next() >> 24
+
+    def words(self, n):
+        return ' '.join(WORDS[self.next() % len(WORDS)] for _ in range(n))
+
+
+# ══════════════════════════════════════════════════════════════════════
+# AUDIO
+# ══════════════════════════════════════════════════════════════════════
+
+RATE = 44100
+CHORDS = [(220, 277, 330), (247, 311, 370), (196, 247, 294), (262, 330, 392)]
+
+
+def _second_of_audio(freqs):
+    """Une seconde stéréo 16 bits d'un accord — fréquences entières, donc
+    périodique : les secondes s'enchaînent sans clic."""
+    frames = bytearray()
+    for i in range(RATE):
+        t = i / RATE
+        s = sum(math.sin(2 * math.pi * f * t) for f in freqs) / len(freqs)
+        left = int(s * 12000)
+        right = int(s * 9000)
+        frames += struct.pack('<hh', left, right)
+    return bytes(frames)
+
+
+def gen_wav(path, size_mb):
+    blocks = [_second_of_audio(c) for c in CHORDS]
+    remaining = size_mb * MB - 44          # en-tête RIFF/WAVE standard
+    remaining -= remaining % 4
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        i = 0
+        while remaining > 0:
+            block = blocks[i % len(blocks)][:remaining]
+            w.writeframesraw(block)
+            remaining -= len(block)
+            i += 1
+
+
+# ══════════════════════════════════════════════════════════════════════
+# PDF
+# ══════════════════════════════════════════════════════════════════════
+
+def _pdf_page_stream(n, rng):
+    """Titre + paragraphe + tableau 12×4 (pdf-to-excel en extrait les cellules)."""
+    ops = ['BT /F1 18 Tf 72 760 Td (Page %d - Quarterly report) Tj ET' % n]
+    ops.append('BT /F1 10 Tf 72 735 Td 14 TL')
+    for _ in range(4):
+        ops.append('(%s) \'' % rng.words(12))
+    ops.append('ET')
+    for row in range(12):
+        y = 660 - row * 22
+        cells = ['Item %d' % (row + 1)] + ['%d.%02d' % (rng.next() % 10000, rng.next() % 100) for _ in range(3)]
+        for col, cell in enumerate(cells):
+            ops.append('BT /F1 10 Tf %d %d Td (%s) Tj ET' % (72 + col * 120, y, cell))
+        ops.append('72 %d m 540 %d l S' % (y - 6, y - 6))
+    return '\n'.join(ops).encode('latin-1')
+
+
+def gen_pdf(path, pages):
+    rng = Lcg(pages)
+    objects = {}
+    # 1 catalogue, 2 arbre des pages, 3 police, puis (page, contenu) par page
+    kids = []
+    for n in range(pages):
+        page_id, content_id = 4 + 2 * n, 5 + 2 * n
+        kids.append(f'{page_id} 0 R')
+        stream = zlib.compress(_pdf_page_stream(n + 1, rng), 6)
+        objects[page_id] = (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>'
+        ).encode()
+        objects[content_id] = (
+            f'<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n'.encode()
+            + stream + b'\nendstream'
+        )
+    objects[1] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[2] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {pages} >>'.encode()
+    objects[3] = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = {}
+    for oid in sorted(objects):
+        offsets[oid] = out.tell()
+        out.write(f'{oid} 0 obj\n'.encode() + objects[oid] + b'\nendobj\n')
+    xref = out.tell()
+    count = max(objects) + 1
+    out.write(f'xref\n0 {count}\n0000000000 65535 f \n'.encode())
+    for oid in range(1, count):
+        out.write(f'{offsets[oid]:010d} 00000 n \n'.encode())
+    out.write(f'trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    path.write_bytes(out.getvalue())
+
+
+# ══════════════════════════════════════════════════════════════════════
+# IMAGES
+# ══════════════════════════════════════════════════════════════════════
+
+def _rgb_rows(width, height):
+    """Dégradé + bruit LCG. 64 lignes bruitées précalculées, décalées par
+    ligne : 36 MB de pixels sans boucle Python par pixel."""
+    rng = Lcg(width * height)
+    noise = [bytes(rng.byte() >> 2 for _ in range(width * 3 + 192)) for _ in range(64)]
+    gradient = bytes((x * 255 // max(width - 1, 1)) >> 1 for x in range(width) for _ in range(3))
+    for y in range(height):
+        shift = (y * 3) % 192
+        row = noise[y % 64][shift:shift + width * 3]
+        tint = (y * 127) // max(height - 1, 1)
+        yield bytes((g + n + tint) & 0xFF for g, n in zip(gradient, row))
+
+
+def gen_png(path, width, height):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body) & 0xFFFFFFFF)
+
+    comp = zlib.compressobj(6)
+    idat = bytearray()
+    for row in _rgb_rows(width, height):
+        idat += comp.compress(b'\x00' + row)
+    idat += comp.flush()
+    path.write_bytes(
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', bytes(idat))
+        + chunk(b'IEND', b'')
+    )
+
+
+def gen_pillow(path, width, height, fmt, **opts):
+    """JPEG / WebP via Pillow. Retourne False si Pillow (ou le codec) manque."""
+    if Image is None:
+        return False
+    if PIL.__version__ != PILLOW_VERSION:
+        print(f'  WARN {path.name} — Pillow {PIL.__version__} ≠ {PILLOW_VERSION} : '
+              'octets (et sha256) différents de ceux de la baseline CI')
+    try:
+        img = Image.frombytes('RGB', (width, height), b''.join(_rgb_rows(width, height)))
+        img.save(path, fmt, **opts)
+    except (OSError, KeyError):   # codec non compilé dans Pillow
+        return False
+    return True
+
+
+# ══════════════════════════════════════════════════════════════════════
+# OFFICE (OOXML minimal, zip à date fixe)
+# ══════════════════════════════════════════════════════════════════════
+
+def _write_zip(path, parts):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        for name, data in parts:
+            info = zipfile.ZipInfo(name, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            z.writestr(info, data)
+
+
+RELS_HEAD = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+PKG_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+DOC_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+def gen_docx(path, pages):
+    rng = Lcg(pages * 31)
+    body = []
+    for n in range(pages):
+        body.append(f'<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+                    f'<w:r><w:t>Section {n + 1}</w:t></w:r></w:p>')
+        for _ in range(12):
+            body.append(f'<w:p><w:r><w:t>{rng.words(40)}</w:t></w:r></w:p>')
+        if n < pages - 1:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+    document = (
+        RELS_HEAD
+        + '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        + '<w:body>' + ''.join(body) + '</w:body></w:document>'
+    )
+    _write_zip(path, [
+        ('[Content_Types].xml', RELS_HEAD +
+         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+         '<Default Extension="xml" ContentType="application/xml"/>'
+         '<Override PartName="/word/document.xml" '
+         'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+         '</Types>'),
+        ('_rels/.rels', RELS_HEAD + f'<Relationships xmlns="{PKG_RELS}">'
+         f'<Relationship Id="rId1" Type="{DOC_REL}/officeDocument" Target="word/document.xml"/>'
+         '</Relationships>'),
+        ('word/_rels/document.xml.rels', RELS_HEAD + f'<Relationships xmlns="{PKG_RELS}"></Relationships>'),
+        ('word/document.xml', document),
+    ])
+
+
+def gen_xlsx(path, rows):
+    rng = Lcg(rows)
+    cols = 'ABCDEF'
+    header = ['Date', 'Region', 'Product', 'Units', 'Price', 'Total']
+    lines = ['<row r="1">' + ''.join(
+        f'<c r="{c}1" t="inlineStr"><is><t>{h}</t></is></c>' for c, h in zip(cols, header)) + '</row>']
+    for r in range(2, rows + 2):
+        units, price = rng.next() % 500, (rng.next() % 100000) / 100
+        lines.append(
+            f'<row r="{r}">'
+            f'<c r="A{r}" t="inlineStr"><is><t>2026-{1 + r % 12:02d}-{1 + r % 28:02d}</t></is></c>'
+            f'<c r="B{r}" t="inlineStr"><is><t>{WORDS[rng.next() % len(WORDS)]}</t></is></c>'
+            f'<c r="C{r}" t="inlineStr"><is><t>{WORDS[rng.next() % len(WORDS)]}</t></is></c>'
+            f'<c r="D{r}"><v>{units}</v></c><c r="E{r}"><v>{price:.2f}</v></c>'
+            f'<c r="F{r}"><v>{units * price:.2f}</v></c></row>'
+        )
+    sheet = (RELS_HEAD + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             '<sheetData>' + ''.join(lines) + '</sheetData></worksheet>')
+    _write_zip(path, [
+        ('[Content_Types].xml', RELS_HEAD +
+         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+         '<Default Extension="xml" ContentType="application/xml"/>'
+         '<Override PartName="/xl/workbook.xml" '
+         'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+         '<Override PartName="/xl/worksheets/sheet1.xml" '
+         'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+         '</Types>'),
+        ('_rels/.rels', RELS_HEAD + f'<Relationships xmlns="{PKG_RELS}">'
+         f'<Relationship Id="rId1" Type="{DOC_REL}/officeDocument" Target="xl/workbook.xml"/>'
+         '</Relationships>'),
+        ('xl/workbook.xml', RELS_HEAD +
+         '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+         f'xmlns:r="{DOC_REL}"><sheets><sheet name="Sales" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+        ('xl/_rels/workbook.xml.rels', RELS_HEAD + f'<Relationships xmlns="{PKG_RELS}">'
+         f'<Relationship Id="rId1" Type="{DOC_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+         '</Relationships>'),
+        ('xl/worksheets/sheet1.xml', sheet),
+    ])
+
+
+# ══════════════════════════════════════════════════════════════════════
+# RUNNER
+# ══════════════════════════════════════════════════════════════════════
+
+# (famille, fichier, générateur) — noms repris tels quels par tests/bench.js
+FIXTURES = [
+    ('wav',  'wav-1mb.wav',     lambda p: gen_wav(p, 1)),
+    ('wav',  'wav-10mb.wav',    lambda p: gen_wav(p, 10)),
+    ('wav',  'wav-100mb.wav',   lambda p: gen_wav(p, 100)),
+    ('pdf',  'pdf-1p.pdf',      lambda p: gen_pdf(p, 1)),
+    ('pdf',  'pdf-100p.pdf',    lambda p: gen_pdf(p, 100)),
+    ('pdf',  'pdf-1000p.pdf',   lambda p: gen_pdf(p, 1000)),
+    ('png',  'png-12mp.png',    lambda p: gen_png(p, IMG_W, IMG_H)),
+    ('jpg',  'jpg-12mp.jpg',    lambda p: gen_pillow(p, IMG_W, IMG_H, 'JPEG', quality=90)),
+    ('webp', 'webp-12mp.webp',  lambda p: gen_pillow(p, IMG_W, IMG_H, 'WEBP', quality=90, method=4)),
+    ('docx', 'docx-50p.docx',   lambda p: gen_docx(p, 50)),
+    ('xlsx', 'xlsx-10k.xlsx',   lambda p: gen_xlsx(p, 10000)),
+]
+
+
+def digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(MB), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def generate(out=DEFAULT_OUT, only=None, force=False):
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / 'manifest.json'
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8')) if manifest_path.exists() else {}
+    for family, name, gen in FIXTURES:
+        if only and family not in only:
+            continue
+        path = out / name
+        if path.exists() and not force:
+            status = 'skip'
+        elif gen(path) is False:
+            path.unlink(missing_ok=True)
+            manifest.pop(name, None)
+            print(f'  SKIP {name} — Pillow absent ou codec manquant (pip install pillow)')
+            continue
+        else:
+            status = 'generated'
+        manifest[name] = {'bytes': path.stat().st_size, 'sha256': digest(path)}
+        print(f'{status}: {name:<16} {path.stat().st_size / MB:>8.1f} MB  {manifest[name]["sha256"][:12]}')
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    print(f'\nDone: {len(manifest)} fixtures → {out}/')
+    return 0
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    only = None
+    if '--only' in args:
+        i = args.index('--only')
+        only = set(args[i + 1].split(','))
+        del args[i:i + 2]
+    force = '--force' in args
+    args = [a for a in args if not a.startswith('--')]
+    sys.exit(generate(args[0] if args else DEFAULT_OUT, only, force))
@@ -1,13 +1,48 @@
 import glob, re
 
-INJECT_SCHEMA  = '<script src="/schema-inject.js"></script>'
-INJECT_ADSENSE_HEAD = '<script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-6238323731269830" crossorigin="anonymous"></script>'
+# Ads + analytics : plus de balise <script src> directe, un loader inline les
+# charge quand la page est idle et jamais pendant le chargement d'un moteur
+# WASM (les pages outils émettent tc:engine-loading / tc:engine-ready).
+# Vercel Insights n'est chargé que sur les pages qui définissent window.va.
+INJECT_3P_LOADER = """<script id="tc-3p">
+(function(){
+  var holds = 0, idle = false, done = false;
+  function load(){
+    if (done || !idle || holds > 0) return;
+    done = true;
+    var ads = document.createElement('script');
+    ads.async = true; ads.crossOrigin = 'anonymous';
+    ads.src = 'https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-6238323731269830';
+    document.head.appendChild(ads);
+    if (window.va) {
+      var va = document.createElement('script');
+      va.defer = true; va.src = '/_vercel/insights/script.js';
+      document.head.appendChild(va);
+    }
+  }
+  document.addEventListener('tc:engine-loading', function(){ holds++; });
+  document.addEventListener('tc:engine-ready', function(){ holds = Math.max(0, holds - 1); load(); });
+  window.addEventListener('load', function(){
+    var ric = window.requestIdleCallback || function(cb){ return setTimeout(cb, 2000); };
+    ric(function(){ idle = true; load(); }, {timeout: 5000});
+  });
+})();
+</script>"""
+# Copie du loader déjà présente dans une page : remplacée à chaque run, pour que
+# toute modification d'INJECT_3P_LOADER atteigne toutes les pages
+TC3P_BLOCK = re.compile(r'<script id="tc-3p">[\s\S]*?</script>')
+# Balises tierces chargées en direct (migration vers le loader)
+EAGER_3P_TAGS = re.compile(
+    r'[ \t]*<script\b[^>]*\bsrc="(?:https://pagead2\.googlesyndication\.com/pagead/js/adsbygoogle\.js[^"]*'
+    r'|/_vercel/insights/script\.js)"[^>]*>\s*</script>\n?'
+)
 INJECT_FAVICON = '<link rel="icon" type="image/svg+xml" href="/favicon.svg"/>'
 
-# Fichiers gérés manuellement — exclus de l'injection schema
-EXCLUDE_SCHEMA = ['mp4-to-mp3.html', 'mp3-to-mp4.html', 'mp3-to-wav.html', 'wav-to-mp3.html']
+# Le schema ld+json est généré inline par build-site.py depuis tools.json
+# (ancien script runtime schema-inject.js retiré)
+RUNTIME_SCHEMA = '<script src="/schema-inject.js"></script>'
 
-files = glob.glob('*.html')
+files = glob.glob('*.html') + glob.glob('blog/*.html') + glob.glob('vs/*.html')
 changed = []
 
 for filepath in files:
@@ -21,15 +56,10 @@ for filepath in files:
         content = content.replace('</head>', f'{INJECT_FAVICON}\n</head>', 1)
         modified = True
 
-    # ── Injection schema ──────────────────────────────────────────────────────
-    if filepath not in EXCLUDE_SCHEMA:
-        content = re.sub(
-            r'\n?\s*<script type="application/ld\+json">[\s\S]*?</script>',
-            '', content
-        )
-        if 'schema-inject.js' not in content and '</body>' in content:
-            content = content.replace('</body>', f'{INJECT_SCHEMA}\n</body>', 1)
-            modified = True
+    # ── Retrait du schema runtime (migration vers build-site.py) ───────────────
+    if RUNTIME_SCHEMA in content:
+        content = content.replace(f'{RUNTIME_SCHEMA}\n', '').replace(RUNTIME_SCHEMA, '')
+        modified = True
 
     # ── Remplacement placeholder ad par vrai ins AdSense ─────────────────────────
     OLD_AD_PLACEHOLDER = '<div class="ad">Advertisement · 728×90 (Google AdSense)</div>'
@@ -45,14 +75,24 @@ for filepath in files:
         content = content.replace(OLD_AD_PLACEHOLDER, NEW_AD_INS)
         modified = True
 
-    # ── Injection AdSense dans <head> ─────────────────────────────────────────
+    # ── Ads + analytics différés dans <head> ──────────────────────────────────
     # Supprimer l'ancienne balise adsense-inject.js si présente (migration)
     if '<script src="/adsense-inject.js"></script>' in content:
         content = content.replace('\n<script src="/adsense-inject.js"></script>', '')
         content = content.replace('<script src="/adsense-inject.js"></script>\n', '')
         modified = True
-    if 'ca-pub-6238323731269830' not in content and '</head>' in content:
-        content = content.replace('</head>', f'{INJECT_ADSENSE_HEAD}\n</head>', 1)
+    content, n_eager = EAGER_3P_TAGS.subn('', content)
+    if n_eager:
+        modified = True
+    copies = TC3P_BLOCK.findall(content)
+    if copies and copies != [INJECT_3P_LOADER]:
+        # Première copie réécrite, doublons supprimés
+        first = TC3P_BLOCK.search(content)
+        rest = TC3P_BLOCK.sub('', content[first.end():])
+        content = content[:first.start()] + INJECT_3P_LOADER + rest
+        modified = True
+    elif not copies and '</head>' in content:
+        content = content.replace('</head>', f'{INJECT_3P_LOADER}\n</head>', 1)
         modified = True
 
     with open(filepath, 'w', encoding='utf-8') as f:
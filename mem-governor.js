@@ -0,0 +1,196 @@
+/* TurboConvert — gouverneur mémoire + annulation des conversions
+ * ----------------------------------------------------------------
+ * Chargé par chaque page outil (bloc build:governor généré par build-site.py
+ * depuis tools.json) :
+ *   <script defer src="/mem-governor.js" data-limit-mb="500" data-base-mb="96"
+ *           data-factor="3" data-wasm="1"></script>
+ *
+ * Avant une conversion, la page appelle TCMem.start(fichier(s), {progress, chunkBytes}) :
+ *   - taille > limite de l'outil (size_limit_mb) : refus immédiat
+ *   - besoin estimé = base moteur + facteur × taille d'entrée
+ *   - budget = part de navigator.deviceMemory, moins la mémoire déjà utilisée
+ *     (performance.memory, ou la dernière mesure measureUserAgentSpecificMemory
+ *     prise en idle sur les pages isolées), plafonné au heap WASM 32 bits
+ *   - stratégie 'memory' si ça tient, 'chunked' si la page sait découper et
+ *     qu'un segment tient, sinon erreur lisible au lieu d'un onglet qui crashe
+ * Le job renvoyé porte un AbortController : bouton Cancel dans la zone de
+ * progression, job.wrap(promesse) pour interrompre une attente, job.onAbort(fn)
+ * pour libérer le moteur (ffmpeg.exit(), worker.terminate(), FS.unlink…).
+ * TCMem.url(blob) suit les object URLs de résultat, révoquées au job suivant,
+ * sur TCMem.release() (bouton « again ») et au pagehide hors bfcache.
+ */
+(function(){
+  var MB = 1048576, GB = 1024 * MB;
+  var TAB_SHARE = 0.4;          // part de la RAM qu'un onglet peut raisonnablement prendre
+  var WASM_MAX = 2 * GB;        // heap max des cores Emscripten (ffmpeg, ghostscript, libheif)
+
+  var el = document.currentScript;
+  var data = (el && el.dataset) || {};
+  var config = {
+    limitMb: Number(data.limitMb) || 100,
+    baseMb: Number(data.baseMb) || 0,
+    factor: Number(data.factor) || 4,
+    wasm: data.wasm === '1'
+  };
+
+  var urls = [];
+  var current = null;
+  var cancelBtn = null;
+  var measured = 0;             // dernière mesure measureUserAgentSpecificMemory (octets)
+  var measuring = false;
+  var ric = window.requestIdleCallback || function(cb){ return setTimeout(cb, 2000); };
+
+  function abortError(){
+    try { return new DOMException('Conversion cancelled', 'AbortError'); }
+    catch(e){ var err = new Error('Conversion cancelled'); err.name = 'AbortError'; return err; }
+  }
+
+  function totalSize(files){
+    if (!files) return 0;
+    if (typeof files.size === 'number' && !files.length) return files.size;
+    var sum = 0;
+    for (var i = 0; i < files.length; i++) {
+      var f = files[i] && (files[i].file || files[i]);
+      sum += (f && f.size) || 0;
+    }
+    return sum;
+  }
+
+  function deviceBytes(){
+    if (navigator.deviceMemory) return navigator.deviceMemory * GB;   // plafonné à 8 par le navigateur
+    // Firefox / Safari n'exposent rien : mobile prudent, desktop généreux
+    var mobile = navigator.userAgentData ? navigator.userAgentData.mobile
+      : /Mobi|Android|iPhone|iPad/.test(navigator.userAgent);
+    return (mobile ? 3 : 8) * GB;
+  }
+
+  // measureUserAgentSpecificMemory ne résout qu'au GC suivant (jusqu'à ~20 s) :
+  // lancée en idle au chargement et après chaque job, jamais attendue au clic
+  function measureLater(){
+    if (measuring || !(self.crossOriginIsolated && performance.measureUserAgentSpecificMemory)) return;
+    measuring = true;
+    ric(function(){
+      performance.measureUserAgentSpecificMemory()
+        // Résolue pendant un job : pic transitoire, remesuré à la fin du job
+        .then(function(r){ if (!current) measured = r.bytes; }, function(){})
+        .then(function(){ measuring = false; });
+    });
+  }
+
+  function usedBytes(){
+    var pm = performance.memory;
+    return Math.max(measured, pm ? pm.usedJSHeapSize : 0);
+  }
+
+  function budget(){
+    var avail = Math.max(0, deviceBytes() * TAB_SHARE - usedBytes());
+    return config.wasm ? Math.min(avail, WASM_MAX) : avail;
+  }
+
+  function estimate(bytes){
+    return config.baseMb * MB + config.factor * bytes;
+  }
+
+  function showCancel(progress, onClick){
+    if (!progress) return;
+    if (!cancelBtn) {
+      cancelBtn = document.createElement('button');
+      cancelBtn.type = 'button';
+      cancelBtn.className = 'tc-cancel';
+      cancelBtn.textContent = 'Cancel';
+      cancelBtn.style.cssText = 'display:block;margin:.75rem auto 0;padding:.3rem .9rem;background:none;'
+        + 'border:1px solid currentColor;border-radius:6px;font:inherit;font-size:.8rem;cursor:pointer;opacity:.7';
+    }
+    cancelBtn.onclick = onClick;
+    cancelBtn.disabled = false;
+    progress.appendChild(cancelBtn);
+  }
+
+  function hideCancel(){
+    if (cancelBtn && cancelBtn.parentNode) cancelBtn.parentNode.removeChild(cancelBtn);
+  }
+
+  function revokeAll(){
+    while (urls.length) URL.revokeObjectURL(urls.pop());
+  }
+
+  function start(files, opts){
+    opts = opts || {};
+    if (current) current.abort();
+    revokeAll();
+    var size = totalSize(files);
+    if (size > config.limitMb * MB) {
+      return Promise.reject(new Error('File too large. Max ' + config.limitMb + ' MB.'));
+    }
+    var avail = budget();
+    var need = estimate(size);
+    var strategy = 'memory';
+    if (need > avail) {
+      if (opts.chunkBytes && estimate(Math.min(opts.chunkBytes, size)) <= avail) {
+        strategy = 'chunked';
+      } else {
+        var err = new Error('Not enough memory on this device for this file (needs about '
+          + Math.ceil(need / MB) + ' MB, about ' + Math.floor(avail / MB)
+          + ' MB available). Close other tabs or try a smaller file.');
+        err.name = 'TCMemoryError';
+        return Promise.reject(err);
+      }
+    }
+    return Promise.resolve(createJob(strategy, need, avail, opts));
+  }
+
+  function createJob(strategy, need, avail, opts){
+    var controller = new AbortController();
+    var teardowns = [];
+    var aborted = new Promise(function(_, reject){
+      controller.signal.addEventListener('abort', function(){ reject(abortError()); });
+    });
+    aborted.catch(function(){});
+
+    var job = {
+      signal: controller.signal,
+      strategy: strategy,
+      need: need,
+      budget: avail,
+      // Budget serré : la page peut réduire sa résolution / sa taille de lot
+      tight: need > avail / 2,
+      check: function(){ if (controller.signal.aborted) throw abortError(); },
+      wrap: function(promise){ return Promise.race([promise, aborted]); },
+      onAbort: function(fn){ teardowns.push(fn); return job; },
+      abort: function(){
+        if (controller.signal.aborted) return;
+        if (cancelBtn) cancelBtn.disabled = true;
+        controller.abort();
+        while (teardowns.length) {
+          try { teardowns.pop()(); } catch(e) {}
+        }
+        job.end();
+      },
+      end: function(){
+        teardowns.length = 0;
+        hideCancel();
+        if (current === job) { current = null; measureLater(); }
+      }
+    };
+    current = job;
+    showCancel(opts.progress, job.abort);
+    return job;
+  }
+
+  window.TCMem = {
+    config: config,
+    budget: budget,
+    estimate: estimate,
+    start: start,
+    url: function(blob){ var u = URL.createObjectURL(blob); urls.push(u); return u; },
+    release: function(){ if (current) current.abort(); revokeAll(); },
+    isAbort: function(e){ return !!e && e.name === 'AbortError'; }
+  };
+
+  window.addEventListener('pagehide', function(e){
+    if (current) current.abort();
+    if (!e.persisted) revokeAll();   // retour bfcache : les liens de téléchargement restent valides
+  });
+
+  measureLater();
+})();
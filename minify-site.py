@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+TurboConvert — Minification + précompression avant déploiement
+==============================================================
+Usage : python3 minify-site.py [source/] [sortie/]     (défaut : . → dist/)
+
+Copie le site statique dans dist/ en :
+  - minifiant les blocs <style> et <script> inline (commentaires, indentation)
+  - compactant les ld+json / speculationrules (json.dumps sans espaces)
+  - réduisant les espaces entre balises (hors <pre>, <textarea>)
+  - émettant des frères .gz (et .br si le module brotli est installé)
+Affiche un tableau avant/après par page. Jouer APRÈS build-site.py et
+inject-schema.py — les sources restent lisibles, seul dist/ est minifié.
+"""
+
+import gzip, json, re, shutil, sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optionnel — seul le .gz est émis
+    brotli = None
+
+# Fichiers de dev non déployés
+EXCLUDE = {
+    'dist', 'node_modules', 'tests', 'playwright-report', 'test-results',
+    'package.json', 'package-lock.json', 'playwright.config.js', 'turboconvert.spec.js',
+    'vercel.json', 'requests.jsonl',
+}
+EXCLUDE_SUFFIXES = {'.py', '.pyc', '.md'}
+
+# Types texte précompressés
+COMPRESS_SUFFIXES = {'.html', '.xml', '.txt', '.svg', '.js', '.json', '.css'}
+
+JS_TYPES   = {'', 'text/javascript', 'application/javascript', 'module'}
+JSON_TYPES = {'application/ld+json', 'speculationrules', 'importmap', 'application/json'}
+
+# Après ces caractères, un « / » ouvre une regex et non une division
+REGEX_PREV = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+    'void', 'throw', 'instanceof', 'yield', 'await',
+}
+# Un espace à côté de ces caractères est superflu
+JS_TIGHT = set('{}()[];,=:?&|*%^~')
+CSS_TIGHT = set('{};,')
+
+
+# ══════════════════════════════════════════════════════════════════════
+# JS
+# ══════════════════════════════════════════════════════════════════════
+
+def _read_quoted(src, i, quote):
+    """Retourne l'index juste après la chaîne ouverte en src[i]."""
+    i += 1
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def _read_regex(src, i):
+    """Retourne l'index juste après le littéral regex ouvert en src[i] (flags inclus)."""
+    i += 1
+    in_class = False
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            break
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < len(src) and (src[i].isalnum() or src[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _minify_js(src, i=0, in_template=False):
+    """Tokenizer minimal : retire commentaires et espaces superflus, garde les
+    retours à la ligne (ASI). Retourne (code, index). Dans une substitution
+    ${…} de template literal, s'arrête sur l'accolade fermante."""
+    out = []
+    depth = 0
+    word = ''       # dernier identifiant émis (détection regex après return…)
+    pending = ''    # espace en attente : '', ' ' ou '\n'
+    n = len(src)
+
+    def last():
+        return out[-1][-1] if out and out[-1] else ''
+
+    def emit(tok):
+        nonlocal pending
+        if pending and out:
+            prev, nxt = last(), tok[0]
+            if pending == '\n' and (prev in '{;,([' or nxt in ',;)]}'):
+                pending = ' '
+            if pending == ' ' and (prev in JS_TIGHT or nxt in JS_TIGHT):
+                pending = ''
+            out.append(pending)
+        pending = ''
+        out.append(tok)
+
+    while i < n:
+        c = src[i]
+        if c in ' \t\r\n':
+            j = i
+            while j < n and src[j] in ' \t\r\n':
+                j += 1
+            if '\n' in src[i:j] or pending == '\n':
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i = j
+            continue
+        if src.startswith('//', i):
+            j = src.find('\n', i)
+            i = n if j < 0 else j
+            continue
+        if src.startswith('/*', i):
+            j = src.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+            if not pending:
+                pending = ' '
+            continue
+        if c in '\'"':
+            j = _read_quoted(src, i, c)
+            emit(src[i:j]); word = ''
+            i = j
+            continue
+        if c == '`':
+            # template literal : texte brut + substitutions minifiées récursivement
+            parts, j = ['`'], i + 1
+            while j < n and src[j] != '`':
+                if src[j] == '\\':
+                    parts.append(src[j:j + 2]); j += 2
+                elif src.startswith('${', j):
+                    inner, j = _minify_js(src, j + 2, in_template=True)
+                    parts.append('${' + inner + '}'); j += 1
+                else:
+                    parts.append(src[j]); j += 1
+            parts.append('`')
+            emit(''.join(parts)); word = ''
+            i = j + 1
+            continue
+        if c == '/':
+            prev = last()
+            if not out or prev in REGEX_PREV or word in REGEX_KEYWORDS:
+                j = _read_regex(src, i)
+                emit(src[i:j]); word = ''
+                i = j
+                continue
+        if in_template:
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                if depth == 0:
+                    return ''.join(out), i
+                depth -= 1
+        if c.isalnum() or c in '_$':
+            j = i
+            while j < n and (src[j].isalnum() or src[j] in '_$'):
+                j += 1
+            word = src[i:j]
+            emit(word)
+            i = j
+            continue
+        emit(c); word = ''
+        i += 1
+    return ''.join(out), i
+
+
+def minify_js(src):
+    return _minify_js(src)[0].strip()
+
+
+# ══════════════════════════════════════════════════════════════════════
+# CSS / JSON / HTML
+# ══════════════════════════════════════════════════════════════════════
+
+def minify_css(src):
+    out = []
+    pending = False
+    i, n = 0, len(src)
+    while i < n:
+        c = src[i]
+        if src.startswith('/*', i):
+            j = src.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+            continue
+        if c in ' \t\r\n':
+            pending = True
+            i += 1
+            continue
+        if pending and out and out[-1][-1] not in CSS_TIGHT | {':'} and c not in CSS_TIGHT:
+            out.append(' ')
+        pending = False
+        if c in '\'"':
+            j = _read_quoted(src, i, c)
+            out.append(src[i:j])
+            i = j
+            continue
+        if c == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(c)
+        i += 1
+    return ''.join(out)
+
+
+def minify_json(src):
+    try:
+        return json.dumps(json.loads(src), separators=(',', ':'), ensure_ascii=False)
+    except ValueError:
+        return src.strip()
+
+
+RAW_BLOCK = re.compile(
+    r'(<(script|style|pre|textarea)\b([^>]*)>)([\s\S]*?)(</\2\s*>)', re.IGNORECASE)
+TAG = re.compile(r'<[a-zA-Z/!][^<>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^<>"\']*)*>')
+# Commentaires conservés : conditionnels IE et marqueurs build-site.py (vérifiés par T28/T29)
+COMMENT = re.compile(r'<!--(?!\[if|\s*/?build:)[\s\S]*?-->')
+TYPE_ATTR = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+
+
+def _collapse(text):
+    """Un blanc (espace ou saut de ligne) suffit entre deux éléments HTML."""
+    return re.sub(r'\s+', lambda m: '\n' if '\n' in m.group(0) else ' ', text)
+
+
+def _collapse_markup(html):
+    html = COMMENT.sub('', html)
+    out, pos = [], 0
+    for m in TAG.finditer(html):
+        out.append(_collapse(html[pos:m.start()]))
+        # Dans une balise : espaces réduits hors valeurs d'attributs
+        out.append(re.sub(r'("[^"]*"|\'[^\']*\')|\s+',
+                          lambda a: a.group(1) or ' ', m.group(0)))
+        pos = m.end()
+    out.append(_collapse(html[pos:]))
+    return ''.join(out)
+
+
+def minify_html(html):
+    out, pos = [], 0
+    for m in RAW_BLOCK.finditer(html):
+        out.append(_collapse_markup(html[pos:m.start()]))
+        open_tag, tag, attrs, body, close_tag = m.groups()
+        tag = tag.lower()
+        if tag == 'style':
+            body = minify_css(body)
+        elif tag == 'script':
+            t = TYPE_ATTR.search(attrs)
+            kind = t.group(1).lower() if t else ''
+            if kind in JS_TYPES:
+                body = minify_js(body)
+            elif kind in JSON_TYPES:
+                body = minify_json(body)
+        out.append(_collapse_markup(open_tag) + body + close_tag)
+        pos = m.end()
+    out.append(_collapse_markup(html[pos:]))
+    return ''.join(out).strip() + '\n'
+
+
+# ══════════════════════════════════════════════════════════════════════
+# RUNNER
+# ══════════════════════════════════════════════════════════════════════
+
+def precompress(path):
+    """Écrit path.gz (et path.br). Retourne (taille gz, taille br ou None)."""
+    data = path.read_bytes()
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    Path(f'{path}.gz').write_bytes(gz)
+    br = None
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        Path(f'{path}.br').write_bytes(br)
+    return len(gz), (len(br) if br is not None else None)
+
+
+def iter_site(src):
+    for p in sorted(src.rglob('*')):
+        rel = p.relative_to(src)
+        if any(part.startswith('.') or part in EXCLUDE for part in rel.parts):
+            continue
+        if p.is_file() and p.suffix not in EXCLUDE_SUFFIXES and p.suffix not in ('.gz', '.br'):
+            yield p, rel
+
+
+def build(src='.', dest='dist'):
+    src, dest = Path(src), Path(dest)
+    if dest.exists():
+        shutil.rmtree(dest)
+    rows = []
+    for path, rel in iter_site(src):
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == '.html':
+            raw = path.read_text(encoding='utf-8')
+            target.write_text(minify_html(raw), encoding='utf-8')
+        else:
+            shutil.copy2(path, target)
+        if path.suffix in COMPRESS_SUFFIXES:
+            gz, br = precompress(target)
+            if path.suffix == '.html':
+                rows.append((str(rel), path.stat().st_size, target.stat().st_size, gz, br))
+
+    def fmt(v):
+        return '—' if v is None else f'{v / 1024:.1f}'
+
+    width = max(len(r[0]) for r in rows) if rows else 10
+    print(f'{"page":<{width}}  {"raw KB":>8}  {"min KB":>8}  {"gz KB":>7}  {"br KB":>7}  {"gain":>6}')
+    print('-' * (width + 46))
+    for name, raw, mini, gz, br in rows:
+        best = br if br is not None else gz
+        print(f'{name:<{width}}  {fmt(raw):>8}  {fmt(mini):>8}  {fmt(gz):>7}  {fmt(br):>7}  {1 - best / raw:>6.0%}')
+    print('-' * (width + 46))
+    total_raw = sum(r[1] for r in rows)
+    total_min = sum(r[2] for r in rows)
+    total_gz = sum(r[3] for r in rows)
+    total_br = None if brotli is None else sum(r[4] for r in rows)
+    best = total_br if total_br is not None else total_gz
+    print(f'{"TOTAL":<{width}}  {fmt(total_raw):>8}  {fmt(total_min):>8}  {fmt(total_gz):>7}  {fmt(total_br):>7}  {1 - best / max(total_raw, 1):>6.0%}')
+    if brotli is None:
+        print('\n(brotli non installé — pip install brotli pour émettre les .br)')
+    print(f'\nDone: {len(rows)} pages → {dest}/')
+    return 0
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    sys.exit(build(*(args[:2] or ['.'])))
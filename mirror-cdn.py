@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+TurboConvert — Miroir local des moteurs CDN pour les tests E2E
+==============================================================
+Usage : python3 mirror-cdn.py [dossier-miroir/]     (défaut : tests/cdn-mirror/)
+        python3 mirror-cdn.py --check               (vérifie sans réseau)
+
+Télécharge UNE fois les assets moteur (FFmpeg, pdf.js, Ghostscript…) listés
+dans tools.json, plus les URLs jsDelivr écrites en dur dans les pages, et
+suit les imports des modules ESM (+esm, .mjs). Le miroir est ensuite en
+lecture seule : tests/offline.js le sert via context.route(), sans réseau.
+
+  <miroir>/index.json              url → {path, type, bytes, sha256}
+  <miroir>/cdn.jsdelivr.net/npm/…  fichiers bruts (chmod 444)
+
+Les entrées déjà présentes et intactes (sha256) ne sont pas retéléchargées.
+Exit code 0 = miroir complet, 1 = asset manquant ou corrompu.
+"""
+
+import glob, hashlib, json, os, re, sys, urllib.parse, urllib.request
+from pathlib import Path
+
+MANIFEST = 'tools.json'
+DEFAULT_MIRROR = 'tests/cdn-mirror'
+INDEX = 'index.json'
+CDN_HOSTS = ('cdn.jsdelivr.net',)
+
+# URL littérale dans une page (les gabarits ${…} sont résolus par le manifeste)
+PAGE_URL = re.compile(r'https://(?:%s)/[^"\'`\s)]+' % '|'.join(map(re.escape, CDN_HOSTS)))
+# Imports statiques / dynamiques d'un module ESM jsDelivr : from"/npm/…", import("/npm/…")
+ESM_IMPORT = re.compile(r'(?:\bfrom|\bimport)\s*\(?\s*["\'](/npm/[^"\']+)["\']')
+
+
+def manifest_urls(base='.'):
+    """Assets moteur de tools.json, dans l'ordre du manifeste."""
+    with open(Path(base) / MANIFEST, encoding='utf-8') as f:
+        manifest = json.load(f)
+    return [url for urls in manifest['engines'].values() for url in urls]
+
+
+def page_urls(base='.'):
+    """URLs CDN écrites en dur dans les pages (ex. fallback heic2any)."""
+    urls = []
+    for path in sorted(glob.glob(os.path.join(base, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            urls += [u for u in PAGE_URL.findall(f.read()) if '${' not in u]
+    return urls
+
+
+def mirror_path(url):
+    """https://cdn.jsdelivr.net/npm/x@1/y.js → cdn.jsdelivr.net/npm/x@1/y.js"""
+    parts = urllib.parse.urlsplit(url)
+    return f'{parts.netloc}{urllib.parse.unquote(parts.path)}'
+
+
+def esm_imports(url, body):
+    """Dépendances d'un module ESM jsDelivr, en URLs absolues."""
+    path = urllib.parse.urlsplit(url).path
+    if not (path.endswith('+esm') or path.endswith('.mjs')):
+        return []
+    text = body.decode('utf-8', errors='replace')
+    return [urllib.parse.urljoin(url, dep) for dep in ESM_IMPORT.findall(text)]
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def intact(mirror, entry):
+    path = mirror / entry['path']
+    return path.is_file() and sha256(path.read_bytes()) == entry['sha256']
+
+
+def fetch(url):
+    req = urllib.request.Request(url, headers={'User-Agent': 'turboconvert-mirror'})
+    with urllib.request.urlopen(req, timeout=120) as resp:
+        ctype = resp.headers.get('Content-Type', 'application/octet-stream')
+        return resp.read(), ctype
+
+
+def populate(mirror, urls):
+    """Complète le miroir. Retourne le nombre d'échecs."""
+    mirror.mkdir(parents=True, exist_ok=True)
+    index_path = mirror / INDEX
+    index = json.loads(index_path.read_text(encoding='utf-8')) if index_path.exists() else {}
+    queue, seen, failed = list(dict.fromkeys(urls)), set(), 0
+    while queue:
+        url = queue.pop(0)
+        if url in seen:
+            continue
+        seen.add(url)
+        entry = index.get(url)
+        if entry and intact(mirror, entry):
+            body = (mirror / entry['path']).read_bytes()
+            print(f'skip: {url}')
+        else:
+            try:
+                body, ctype = fetch(url)
+            except OSError as e:
+                print(f'  FAIL {url} — {e}')
+                failed += 1
+                continue
+            entry = {'path': mirror_path(url), 'type': ctype,
+                     'bytes': len(body), 'sha256': sha256(body)}
+            target = mirror / entry['path']
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists():
+                target.chmod(0o644)
+            target.write_bytes(body)
+            target.chmod(0o444)   # lecture seule : les tests ne réécrivent jamais le miroir
+            index[url] = entry
+            print(f'mirrored: {url} ({len(body) / 1024:.0f} KB)')
+        queue += [dep for dep in esm_imports(url, body) if dep not in seen]
+    index_path.write_text(json.dumps(index, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    total = sum(e['bytes'] for e in index.values())
+    print(f'\nDone: {len(index)} assets, {total / 1024 / 1024:.1f} MB → {mirror}/')
+    return failed
+
+
+def check(mirror, urls):
+    """Vérifie hors ligne que chaque URL attendue est présente et intacte."""
+    index_path = mirror / INDEX
+    if not index_path.exists():
+        print(f'  FAIL {index_path} absent — lancer python3 mirror-cdn.py')
+        return 1
+    index = json.loads(index_path.read_text(encoding='utf-8'))
+    failed = 0
+    for url in dict.fromkeys(urls):
+        entry = index.get(url)
+        if not entry or not intact(mirror, entry):
+            print(f'  FAIL {url} absent ou corrompu')
+            failed += 1
+    print(f'{len(index)} assets, {failed} manquant(s)')
+    return failed
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    mirror = Path(args[0] if args else DEFAULT_MIRROR)
+    urls = manifest_urls() + page_urls()
+    failed = check(mirror, urls) if '--check' in sys.argv else populate(mirror, urls)
+    sys.exit(1 if failed else 0)
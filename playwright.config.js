@@ -3,15 +3,21 @@ const { defineConfig, devices } = require('@playwright/test');
 
 module.exports = defineConfig({
   testDir: './tests',
-  timeout: 90_000,          // 90s par test (FFmpeg est lourd)
-  expect: { timeout: 60_000 },
-  fullyParallel: false,     // séquentiel pour ne pas saturer la CI
+  timeout: 60_000,          // moteurs servis depuis le miroir local : plus de téléchargement CDN
+  expect: { timeout: 15_000 },
+  fullyParallel: true,      // chaque test a son contexte : répartis entre workers et shards (--shard=1/4)
+  workers: process.env.CI ? 2 : undefined,   // runner GitHub : 2 Chromium + WASM par shard
   retries: process.env.CI ? 1 : 0,
-  reporter: [
-    ['list'],
-    ['html', { outputFolder: 'playwright-report', open: 'never' }],
-    ['github'],             // annotations inline dans les PR GitHub
-  ],
+  reporter: process.env.CI
+    ? [
+        ['list'],
+        ['blob'],           // fusionné par le job report (npx playwright merge-reports)
+        ['github'],         // annotations inline dans les PR GitHub
+      ]
+    : [
+        ['list'],
+        ['html', { outputFolder: 'playwright-report', open: 'never' }],
+      ],
   use: {
     baseURL: process.env.BASE_URL || 'https://turboconvert.io',
     headless: true,
@@ -3,7 +3,7 @@
 TurboConvert — Tests automatisés avant déploiement.
 Bloque le déploiement si un test échoue.
 """
-import os, re, sys, glob
+import os, re, sys, glob, json
 
 errors = []
 warnings = []
@@ -24,6 +24,8 @@ AUDIO_PAGES = {
     'mp3-to-mp4.html': {'input': 'mp3', 'output': 'mp4', 'codec': None},
 }
 
+TOOL_SLUGS = {t['slug'] for t in json.load(open('tools.json', encoding='utf-8'))['tools']}
+
 ALL_HTML = glob.glob('*.html')
 print(f"\nTesting {len(ALL_HTML)} HTML files...\n")
 
@@ -41,16 +43,17 @@ for filepath in ALL_HTML:
     else:
         ok(filepath, "meta description present")
 
-    # Schema : OK si présent OU si inject-schema.py va l'ajouter (schema-inject.js absent = sera ajouté)
-    has_schema = 'schema-inject.js' in content or 'application/ld+json' in content
-    # inject-schema.py va injecter schema-inject.js dans toutes les pages non-audio après ce test
-    will_be_injected = filepath not in AUDIO_PAGES
-    if not has_schema and not will_be_injected:
-        fail(filepath, "Missing Schema.org — add schema-inject.js or ld+json manually")
+    # Schema : ld+json inline obligatoire sur les pages outils (généré par build-site.py)
+    has_schema = 'application/ld+json' in content
+    if not has_schema and filepath[:-5] in TOOL_SLUGS:
+        fail(filepath, "Missing Schema.org — run build-site.py")
     elif has_schema:
         ok(filepath, "Schema.org present")
     else:
-        ok(filepath, "Schema.org will be injected by CI")
+        ok(filepath, "Schema.org optional (not a tool page)")
+
+    if 'schema-inject.js' in content:
+        fail(filepath, "Runtime schema-inject.js still referenced — schema is baked by build-site.py")
 
 # ── Tests pages audio ────────────────────────────────────────────────────────
 for filepath, rules in AUDIO_PAGES.items():
@@ -100,12 +103,20 @@ for filepath, rules in AUDIO_PAGES.items():
 
 # ── Fichiers requis ──────────────────────────────────────────────────────────
 print()
-for f in ['schema-inject.js', 'robots.txt', 'sitemap.xml', 'inject-schema.py']:
+for f in ['tools.json', 'build-site.py', 'mirror-cdn.py', 'gen-fixtures.py', 'mem-governor.js', 'robots.txt', 'sitemap.xml', 'inject-schema.py']:
     if os.path.exists(f):
         ok('repo', f"{f} ✓")
     else:
         fail('repo', f"Required file missing: {f}")
 
+# ── Pillow du benchmark : même version que celle des sha256 JPEG/WebP ────────
+pinned = re.search(r"PILLOW_VERSION = '([^']+)'", open('gen-fixtures.py', encoding='utf-8').read())
+workflow = open('.github/workflows/tests.yml', encoding='utf-8').read()
+if pinned and f"pillow=={pinned.group(1)}" in workflow:
+    ok('repo', f"Pillow {pinned.group(1)} épinglé (gen-fixtures.py = tests.yml) ✓")
+else:
+    fail('repo', "Pillow du job bench ≠ PILLOW_VERSION de gen-fixtures.py — fixtures JPEG/WebP non reproductibles")
+
 # ── Rapport ──────────────────────────────────────────────────────────────────
 print("\n" + "="*60)
 if warnings:
@@ -4,42 +4,44 @@ TurboConvert — Suite de tests anti-régression
 =============================================
 Usage : python3 test-turboconvert.py <fichier.zip>
         python3 test-turboconvert.py <dossier/>
+        python3 test-turboconvert.py <dossier/> --profile --json out.json --junit out.xml
+
+  --profile  temps par check, par page et motifs regex les plus coûteux
+  --json     rapport structuré (check, page, sévérité, message, durée)
+  --junit    rapport JUnit XML (un testcase par check) pour la CI
 
 Jouer AVANT chaque livraison GitHub.
 Exit code 0 = OK, 1 = erreurs bloquantes.
 """
 
-import re, sys, os, json, zipfile, tempfile, shutil
+import re, sys, os, json, ast, zipfile, tempfile, shutil, time, argparse
+import re as _re
+from collections import defaultdict
+from xml.sax.saxutils import escape, quoteattr
 from pathlib import Path
 
 # ══════════════════════════════════════════════════════════════════════
 # CONFIGURATION — source de vérité
 # ══════════════════════════════════════════════════════════════════════
 
+# Manifeste des outils — lu dans le site testé (tools.json livré avec les pages,
+# partagé avec build-site.py). Les constantes ci-dessous en sont dérivées par
+# load_manifest() au lancement de run().
+MANIFEST = {}
+TOOLS = {}
+
 # Tous les liens outils attendus depuis la homepage
-EXPECTED_TOOL_PAGES = [
-    'compress-image', 'compress-pdf', 'excel-to-pdf', 'heic-to-jpg',
-    'jpg-to-pdf', 'jpg-to-png', 'merge-pdf', 'mp3-to-mp4', 'mp3-to-wav',
-    'mp4-to-mp3', 'pdf-to-excel', 'pdf-to-jpg', 'pdf-to-ppt', 'pdf-to-word',
-    'png-to-jpg', 'ppt-to-pdf', 'rotate-pdf', 'split-pdf', 'wav-to-mp3',
-    'webp-to-jpg', 'word-to-jpg', 'word-to-pdf',
-]
+EXPECTED_TOOL_PAGES = []
 
 # Pages qui utilisent FFmpeg WebAssembly (critères stricts)
-FFMPEG_PAGES = ['mp4-to-mp3', 'wav-to-mp3', 'mp3-to-wav', 'mp3-to-mp4']
+FFMPEG_PAGES = []
 FFMPEG_VERSION = '@ffmpeg/ffmpeg@0.11.6'
 FFMPEG_CORE    = '@ffmpeg/core@0.11.0'
 # libmp3lame requis seulement pour les pages qui encodent en MP3
-FFMPEG_MP3_ENCODE_PAGES = ['mp4-to-mp3', 'wav-to-mp3']
-
-# Pages PDF avec pdf-lib ou pdfjs
-PDF_LIB_PAGES = ['merge-pdf', 'split-pdf', 'rotate-pdf', 'compress-pdf', 'pdf-to-jpg']
+FFMPEG_MP3_ENCODE_PAGES = []
 
 # Limite de taille attendue par page (MB) — source de vérité
-SIZE_LIMITS = {
-    'mp4-to-mp3': 500, 'wav-to-mp3': 500,
-    'mp3-to-mp4': 500, 'mp3-to-wav': 500,
-}
+SIZE_LIMITS = {}
 DEFAULT_SIZE_LIMIT = 100  # MB pour toutes les autres
 
 # AdSense client ID attendu
@@ -54,15 +56,42 @@ class TestResult:
         self.errors   = []
         self.warnings = []
         self.passed   = 0
+        self.results  = []   # une entrée par fail/warn : check, page, severity, message
+        self.checks   = []   # une entrée par check : id, name, duration, passed, warnings, errors
+        self.check    = None
 
     def fail(self, page, msg):
         self.errors.append(f'  FAIL [{page}] {msg}')
+        self._record(page, 'error', msg)
 
     def warn(self, page, msg):
         self.warnings.append(f'  WARN [{page}] {msg}')
+        self._record(page, 'warning', msg)
 
     def ok(self):
         self.passed += 1
+        if self.check: self.check['passed'] += 1
+
+    def _record(self, page, severity, msg):
+        check = self.check['id'] if self.check else None
+        self.results.append({'check': check, 'page': page, 'severity': severity, 'message': msg})
+        if self.check: self.check[f'{severity}s'] += 1
+
+    def run_check(self, fn, files):
+        """Exécute un test_* en le chronométrant."""
+        m = _re.match(r'\s*(T\d+)', fn.__doc__ or '')
+        self.check = {'id': m.group(1) if m else fn.__name__, 'name': fn.__name__,
+                      'duration': 0.0, 'passed': 0, 'warnings': 0, 'errors': 0}
+        t0 = time.perf_counter()
+        try:
+            fn(files, self)
+        finally:
+            self.check['duration'] = time.perf_counter() - t0
+            self.checks.append(self.check)
+            for res in self.results:
+                if res['check'] == self.check['id'] and 'duration' not in res:
+                    res['duration'] = self.check['duration']
+            self.check = None
 
     def report(self):
         print('=' * 60)
@@ -76,13 +105,127 @@ class TestResult:
             for e in self.errors: print(e)
         print('=' * 60)
         total = self.passed + len(self.errors)
+        duration = sum(c['duration'] for c in self.checks)
         if self.errors:
-            print(f'🚫 {len(self.errors)} error(s) — deployment BLOCKED.')
+            print(f'🚫 {len(self.errors)} error(s) — deployment BLOCKED. ({duration:.2f}s)')
             return False
         else:
-            print(f'✅ All {self.passed} checks passed — safe to deploy.')
+            print(f'✅ All {self.passed} checks passed — safe to deploy. ({duration:.2f}s)')
             return True
 
+    def write_json(self, path, profile=None):
+        data = {
+            'passed': self.passed, 'warnings': len(self.warnings), 'errors': len(self.errors),
+            'duration': sum(c['duration'] for c in self.checks),
+            'checks': self.checks, 'results': self.results,
+        }
+        if profile: data['profile'] = profile.summary()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def write_junit(self, path):
+        """Un <testcase> par check ; FAIL → <failure>, WARN → <system-out>."""
+        lines = []
+        for c in self.checks:
+            fails = [x for x in self.results if x['check'] == c['id'] and x['severity'] == 'error']
+            warns = [x for x in self.results if x['check'] == c['id'] and x['severity'] == 'warning']
+            name = quoteattr(f"{c['id']} {c['name']}")
+            lines.append(f'  <testcase classname="turboconvert" name={name} time="{c["duration"]:.4f}">')
+            if fails:
+                msg = '\n'.join(f"[{x['page']}] {x['message']}" for x in fails)
+                lines.append(f'    <failure message={quoteattr(f"{len(fails)} error(s)")}>{escape(msg)}</failure>')
+            if warns:
+                msg = '\n'.join(f"WARN [{x['page']}] {x['message']}" for x in warns)
+                lines.append(f'    <system-out>{escape(msg)}</system-out>')
+            lines.append('  </testcase>')
+        n_fail = sum(1 for c in self.checks if c['errors'])
+        total = sum(c['duration'] for c in self.checks)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(f'<testsuite name="turboconvert" tests="{len(self.checks)}" failures="{n_fail}" time="{total:.4f}">\n')
+            f.write('\n'.join(lines) + '\n</testsuite>\n')
+
+
+class RegexProfiler:
+    """--profile : remplace le module re utilisé par les tests et chronomètre
+    chaque appel, attribué au check courant, au motif et à la page analysée."""
+
+    def __init__(self, files, result):
+        self.pages = {id(c): name for name, c in files.items()}
+        self.result = result
+        self.page = None
+        self.by_pattern = defaultdict(lambda: [0.0, 0])
+        self.by_page = defaultdict(float)
+
+    def timed(self, pattern, string, call):
+        # Chaîne dérivée (c.replace, c[:3000]…) → attribuée à la dernière page vue
+        self.page = self.pages.get(id(string), self.page)
+        t0 = time.perf_counter()
+        out = call()
+        if hasattr(out, '__next__'):   # finditer : consommer pour chronométrer le scan
+            out = iter(list(out))
+        dt = time.perf_counter() - t0
+        check = self.result.check['id'] if self.result.check else '?'
+        stat = self.by_pattern[(check, pattern)]
+        stat[0] += dt; stat[1] += 1
+        self.by_page[self.page or '?'] += dt
+        return out
+
+    def summary(self, top=10):
+        patterns = sorted(self.by_pattern.items(), key=lambda kv: -kv[1][0])[:top]
+        pages = sorted(self.by_page.items(), key=lambda kv: -kv[1])[:top]
+        return {
+            'regex': [{'check': k[0], 'pattern': k[1], 'duration': v[0], 'calls': v[1]} for k, v in patterns],
+            'pages': [{'page': k, 'duration': v} for k, v in pages],
+        }
+
+    def report(self, checks, top=10):
+        print('\nPROFILE — checks les plus lents :')
+        for c in sorted(checks, key=lambda c: -c['duration'])[:top]:
+            print(f"  {c['duration'] * 1000:8.1f} ms  {c['id']:<4} {c['name']}")
+        summary = self.summary(top)
+        print('\nPROFILE — pages (temps regex cumulé) :')
+        for p in summary['pages']:
+            print(f"  {p['duration'] * 1000:8.1f} ms  {p['page']}")
+        print('\nPROFILE — motifs regex les plus coûteux :')
+        for p in summary['regex']:
+            pattern = p['pattern'] if len(p['pattern']) <= 70 else p['pattern'][:67] + '...'
+            print(f"  {p['duration'] * 1000:8.1f} ms  {p['calls']:>5}×  {p['check']:<4} {pattern}")
+
+
+class _TimedPattern:
+    def __init__(self, profiler, compiled):
+        self._prof, self._compiled = profiler, compiled
+        self.pattern = compiled.pattern
+
+    def __getattr__(self, method):
+        fn = getattr(self._compiled, method)
+        if method in ('sub', 'subn'):
+            return lambda repl, string, *a: self._prof.timed(self.pattern, string, lambda: fn(repl, string, *a))
+        if method in ('search', 'match', 'fullmatch', 'findall', 'finditer', 'split'):
+            return lambda string, *a: self._prof.timed(self.pattern, string, lambda: fn(string, *a))
+        return fn
+
+
+class _TimedRe:
+    """Proxy du module re (constantes et helpers délégués au vrai module)."""
+    def __init__(self, profiler):
+        self._prof = profiler
+
+    def __getattr__(self, name):
+        return getattr(_re, name)
+
+    def compile(self, pattern, flags=0):
+        return _TimedPattern(self._prof, _re.compile(pattern, flags))
+
+    def search(self, pattern, string, flags=0):   return self.compile(pattern, flags).search(string)
+    def match(self, pattern, string, flags=0):    return self.compile(pattern, flags).match(string)
+    def findall(self, pattern, string, flags=0):  return self.compile(pattern, flags).findall(string)
+    def finditer(self, pattern, string, flags=0): return self.compile(pattern, flags).finditer(string)
+
+    def sub(self, pattern, repl, string, count=0, flags=0):
+        return self.compile(pattern, flags).sub(repl, string, count)
+
 
 def load_site(path_arg):
     """Charge le site depuis un zip ou un dossier. Retourne {nom_fichier: contenu_str}."""
@@ -90,7 +233,7 @@ def load_site(path_arg):
     if path_arg.endswith('.zip'):
         with zipfile.ZipFile(path_arg) as z:
             for name in z.namelist():
-                if name.endswith('.html') or name in ('sitemap.xml', 'robots.txt', 'llms.txt'):
+                if name.endswith('.html') or name in ('sitemap.xml', 'robots.txt', 'llms.txt', 'tools.json'):
                     try:
                         files[name] = z.read(name).decode('utf-8', errors='replace')
                     except Exception:
@@ -99,14 +242,36 @@ def load_site(path_arg):
         base = Path(path_arg)
         for f in base.rglob('*.html'):
             key = str(f.relative_to(base))
+            if key.split(os.sep)[0] in ('dist', 'node_modules'): continue  # sorties de build
             files[key] = f.read_text(errors='replace')
-        for extra in ('sitemap.xml', 'robots.txt', 'llms.txt'):
+        for extra in ('sitemap.xml', 'robots.txt', 'llms.txt', 'tools.json'):
             p = base / extra
             if p.exists():
                 files[extra] = p.read_text()
     return files
 
 
+def canonical_3p_loader():
+    """INJECT_3P_LOADER lu dans inject-schema.py (sans l'exécuter) ; None si introuvable."""
+    path = Path(__file__).resolve().parent / 'inject-schema.py'
+    if not path.exists(): return None
+    for node in ast.parse(path.read_text(encoding='utf-8')).body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'INJECT_3P_LOADER' for t in node.targets):
+            return ast.literal_eval(node.value)
+    return None
+
+
+def load_manifest(files):
+    """Dérive la configuration des checks du tools.json du site testé."""
+    global MANIFEST, TOOLS, EXPECTED_TOOL_PAGES, FFMPEG_PAGES, FFMPEG_MP3_ENCODE_PAGES, SIZE_LIMITS
+    MANIFEST = json.loads(files['tools.json'])
+    TOOLS = {t['slug']: t for t in MANIFEST['tools']}
+    EXPECTED_TOOL_PAGES = sorted(TOOLS)
+    FFMPEG_PAGES = [s for s in EXPECTED_TOOL_PAGES if 'ffmpeg' in TOOLS[s]['engines']]
+    FFMPEG_MP3_ENCODE_PAGES = [s for s in FFMPEG_PAGES if TOOLS[s]['out'] == 'MP3']
+    SIZE_LIMITS = {s: t['size_limit_mb'] for s, t in TOOLS.items()}
+
+
 # ══════════════════════════════════════════════════════════════════════
 # TESTS
 # ══════════════════════════════════════════════════════════════════════
@@ -471,7 +636,7 @@ def test_og_image_present(files, r):
 
 
 def test_schema_inline_not_js(files, r):
-    """T20 — Schemas ld+json injectés inline dans le HTML, pas via schema-inject.js seul."""
+    """T20 — Schemas ld+json inline dans le HTML (générés par build-site.py), pas via JS."""
     for slug in EXPECTED_TOOL_PAGES:
         name = f'{slug}.html'
         c = files.get(name, '')
@@ -479,7 +644,7 @@ def test_schema_inline_not_js(files, r):
         has_inline = 'application/ld+json' in c
         # S'il ne contient que le script externe sans ld+json inline, c'est un problème
         if not has_inline and 'WebApplication' not in c:
-            r.fail(name, 'Schema non inline — Google ne crawle pas toujours le JS (schema-inject.js)')
+            r.fail(name, 'Schema non inline — Google ne crawle pas toujours le JS (lancer build-site.py)')
         else:
             r.ok()
 
@@ -607,49 +772,206 @@ def test_no_zombie_ui(files, r):
             r.ok()
 
 
-def run(path_arg):
+def test_hero_engine_prefetch(files, r):
+    """T28 — index.html : tables TOOL_ENGINES et TOOL_MAP à jour avec tools.json (détecteur + prefetch du Hero)."""
+    index = files.get('index.html', '')
+    if not index: return
+    m = re.search(r'var TOOL_ENGINES\s*=\s*(\{[\s\S]*?\});', index)
+    if not m:
+        r.fail('index.html', 'TOOL_ENGINES absent — lancer build-site.py')
+        return
+    engines = json.loads(m.group(1))
+    for tool in MANIFEST['tools']:
+        expected = []
+        for e in tool['engines']:
+            expected += [u for u in MANIFEST['engines'][e] if u not in expected]
+        if engines.get(f"/{tool['slug']}") != expected:
+            r.fail('index.html', f"TOOL_ENGINES désynchronisé pour /{tool['slug']} — relancer build-site.py")
+        else:
+            r.ok()
+    # Routage du détecteur : chaque suggestion pointe vers un outil du manifeste
+    m = re.search(r'var TOOL_MAP\s*=\s*(\{[\s\S]*?\});', index)
+    if not m:
+        r.fail('index.html', 'TOOL_MAP absent — lancer build-site.py')
+        return
+    routes = json.loads(m.group(1))
+    for ext, slugs in MANIFEST['detector'].items():
+        urls = [t['u'] for t in routes.get(ext, [])]
+        unknown = [u for u in urls if u.lstrip('/') not in TOOLS]
+        if unknown:
+            r.fail('index.html', f"TOOL_MAP[{ext}] → {', '.join(unknown)} absent(s) de tools.json")
+        elif urls != ['/' + s for s in slugs]:
+            r.fail('index.html', f"TOOL_MAP désynchronisé pour .{ext} — relancer build-site.py")
+        else:
+            r.ok()
+    for ext in sorted(set(routes) - set(MANIFEST['detector'])):
+        r.fail('index.html', f"TOOL_MAP[{ext}] hors de tools.json (detector) — relancer build-site.py")
+
+
+def test_schema_baked(files, r):
+    """T29 — Schema généré au build : bloc build:schema sur chaque page outil, plus de schema-inject.js."""
+    for name, c in sorted(files.items()):
+        if not name.endswith('.html'): continue
+        if 'schema-inject.js' in c:
+            r.fail(name, 'schema-inject.js référencé — requête inutile, schema désormais inline (build-site.py)')
+        else:
+            r.ok()
+    for slug in EXPECTED_TOOL_PAGES:
+        name = f'{slug}.html'
+        c = files.get(name, '')
+        if not c: continue
+        m = re.search(r'<!-- build:schema -->\s*<script type="application/ld\+json">([\s\S]*?)</script>', c)
+        if not m:
+            r.fail(name, 'Bloc <!-- build:schema --> absent — lancer build-site.py')
+            continue
+        try:
+            json.loads(m.group(1))
+            r.ok()
+        except ValueError as e:
+            r.fail(name, f'ld+json invalide dans build:schema : {e}')
+
+
+def test_third_party_deferred(files, r):
+    """T30 — Ads/analytics via le loader tc-3p uniquement : pas de <script src> tiers direct, pas de doublon,
+    copie identique au loader canonique d'inject-schema.py (aux espaces près : dist/ est minifié)."""
+    eager = re.compile(
+        r'<script\b[^>]*\bsrc=["\'](?:https://pagead2\.googlesyndication\.com/|/_vercel/insights/)',
+        re.IGNORECASE
+    )
+    squash = lambda js: re.sub(r'\s+', '', js)
+    canonical = canonical_3p_loader()
+    if canonical is None:
+        r.fail('inject-schema.py', 'INJECT_3P_LOADER introuvable — copies du loader tc-3p non vérifiables')
+    else:
+        canonical = squash(canonical)
+    block = re.compile(r'<script id="tc-3p">[\s\S]*?</script>')
+    for name, c in sorted(files.items()):
+        if not name.endswith('.html'): continue
+        n_eager = len(eager.findall(c))
+        n_loader = c.count('id="tc-3p"')
+        copy = block.search(c)
+        if n_eager:
+            r.fail(name, f'{n_eager} balise(s) tierce(s) chargée(s) en direct — concurrence le moteur WASM (relancer inject-schema.py)')
+        elif n_loader > 1:
+            r.fail(name, f'Loader tc-3p dupliqué ({n_loader}×)')
+        elif n_loader == 0 and 'adsbygoogle' in c:
+            r.fail(name, 'Slots AdSense sans loader tc-3p — ads jamais chargées')
+        elif n_loader and canonical and (not copy or squash(copy.group(0)) != canonical):
+            r.fail(name, 'Loader tc-3p périmé (≠ INJECT_3P_LOADER) — relancer inject-schema.py')
+        else:
+            r.ok()
+
+
+def test_memory_governor(files, r):
+    """T31 — mem-governor.js configuré depuis tools.json sur chaque page outil, conversion gardée par TCMem."""
+    tag = re.compile(r'<script\b[^>]*\bsrc=["\']?/mem-governor\.js[^>]*>')
+    for slug in EXPECTED_TOOL_PAGES:
+        name = f'{slug}.html'
+        c = files.get(name, '')
+        if not c: continue
+        tool = TOOLS[slug]
+        m = tag.search(c)
+        if not m:
+            r.fail(name, 'mem-governor.js absent — lancer build-site.py')
+            continue
+        attrs = dict(re.findall(r'data-([\w-]+)=["\']?([^"\'\s>]+)', m.group(0)))
+        base_mb = sum(MANIFEST['engine_heap_mb'][e] for e in tool['engines'])
+        wasm = int(any(e in MANIFEST['wasm_engines'] for e in tool['engines']))
+        expected = {'limit-mb': str(tool['size_limit_mb']), 'base-mb': str(base_mb),
+                    'factor': str(tool['mem_factor']), 'wasm': str(wasm)}
+        errs = [f'data-{k}={attrs.get(k)!r} ≠ {v!r}' for k, v in expected.items() if attrs.get(k) != v]
+        if 'TCMem.start(' not in c:
+            errs.append('conversion sans TCMem.start() — ni budget mémoire ni bouton Cancel')
+        if 'TCMem.release()' not in c:
+            errs.append('TCMem.release() absent du reset — object URLs du résultat jamais révoquées')
+        if slug in FFMPEG_PAGES and not re.search(r'onAbort\([^)]*\)\s*=>\s*\{?[^}]*ffmpeg\.exit\(\)', c):
+            errs.append('Cancel ne libère pas FFmpeg — job.onAbort(() => ffmpeg.exit()) attendu')
+        if errs:
+            for e in errs: r.fail(name, e)
+        else:
+            r.ok()
+
+
+CHECKS = [
+    test_homepage_links,
+    test_page_is_tool_not_blog,
+    test_file_upload_present,
+    test_download_trigger,
+    test_real_conversion_logic,
+    test_ffmpeg_version,
+    test_size_limit,
+    test_seo_og_tags,
+    test_seo_schema,
+    test_adsense,
+    test_title_length,
+    test_canonical,
+    test_indexdb_transfer,
+    test_sitemap_coverage,
+    test_llms_txt,
+    test_no_placeholder_links,
+    # ── Tests v8 : anti-régression sur corrections auditées ──
+    test_no_duplicate_pages,
+    test_meta_description_length,
+    test_og_image_present,
+    test_schema_inline_not_js,
+    test_sitemap_no_dead_urls,
+    test_sitemap_no_extra_urls,
+    test_adsense_guard_present,
+    test_no_double_upload_trigger,
+    test_blog_canonical_correct,
+    test_input_file_hidden,
+    test_no_zombie_ui,
+    test_hero_engine_prefetch,
+    test_schema_baked,
+    test_third_party_deferred,
+    test_memory_governor,
+]
+
+
+def run(path_arg, profile=False, json_out=None, junit_out=None):
+    global re
     print(f'\n📂 Chargement : {path_arg}')
     files = load_site(path_arg)
     print(f'   {len(files)} fichiers chargés\n')
+    if 'tools.json' not in files:
+        print('🚫 tools.json absent du site testé — manifeste des outils requis.')
+        return 1
+    try:
+        load_manifest(files)
+    except (ValueError, KeyError) as e:
+        print(f'🚫 tools.json invalide : {e!r}')
+        return 1
 
     r = TestResult()
+    profiler = None
+    if profile:
+        profiler = RegexProfiler(files, r)
+        re = _TimedRe(profiler)
 
     print('Running tests...')
-    test_homepage_links(files, r)
-    test_page_is_tool_not_blog(files, r)
-    test_file_upload_present(files, r)
-    test_download_trigger(files, r)
-    test_real_conversion_logic(files, r)
-    test_ffmpeg_version(files, r)
-    test_size_limit(files, r)
-    test_seo_og_tags(files, r)
-    test_seo_schema(files, r)
-    test_adsense(files, r)
-    test_title_length(files, r)
-    test_canonical(files, r)
-    test_indexdb_transfer(files, r)
-    test_sitemap_coverage(files, r)
-    test_llms_txt(files, r)
-    test_no_placeholder_links(files, r)
-    # ── Tests v8 : anti-régression sur corrections auditées ──
-    test_no_duplicate_pages(files, r)
-    test_meta_description_length(files, r)
-    test_og_image_present(files, r)
-    test_schema_inline_not_js(files, r)
-    test_sitemap_no_dead_urls(files, r)
-    test_sitemap_no_extra_urls(files, r)
-    test_adsense_guard_present(files, r)
-    test_no_double_upload_trigger(files, r)
-    test_blog_canonical_correct(files, r)
-    test_input_file_hidden(files, r)
-    test_no_zombie_ui(files, r)
+    try:
+        for check in CHECKS:
+            r.run_check(check, files)
+    finally:
+        re = _re
 
     success = r.report()
+    if profiler:
+        profiler.report(r.checks)
+    if json_out:
+        r.write_json(json_out, profiler)
+        print(f'\n📝 JSON  : {json_out}')
+    if junit_out:
+        r.write_junit(junit_out)
+        print(f'📝 JUnit : {junit_out}')
     return 0 if success else 1
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print('Usage: python3 test-turboconvert.py <fichier.zip ou dossier/>')
-        sys.exit(1)
-    sys.exit(run(sys.argv[1]))
+    parser = argparse.ArgumentParser(description='TurboConvert — tests anti-régression')
+    parser.add_argument('path', help='fichier.zip ou dossier/')
+    parser.add_argument('--profile', action='store_true', help='temps par check / page / regex')
+    parser.add_argument('--json', dest='json_out', metavar='FICHIER', help='rapport JSON structuré')
+    parser.add_argument('--junit', dest='junit_out', metavar='FICHIER', help='rapport JUnit XML')
+    args = parser.parse_args()
+    sys.exit(run(args.path, args.profile, args.json_out, args.junit_out))
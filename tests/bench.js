@@ -0,0 +1,282 @@
+#!/usr/bin/env node
+// @ts-check
+// ─── TurboConvert — Benchmark des conversions (gate de performance) ──────────
+// Usage : node tests/bench.js [--update] [--runs 3] [--tolerance 0.25]
+//                             [--only compress-pdf,wav-to-mp3] [--json bench-report.json]
+//
+// Pilote chaque page outil en Chromium headless sur les fixtures de
+// gen-fixtures.py, hors ligne (site SITE_DIR=dist + miroir CDN, voir offline.js).
+// Par cas : médiane sur N runs, contexte neuf à chaque run, de
+//   - ms         : clic Convert → zone de téléchargement visible (time-to-result)
+//   - js_heap_mb : pic de JSHeapUsedSize du thread principal (CDP). Heap JS
+//                  seul : ni ArrayBuffer ni WebAssembly.Memory (FFmpeg,
+//                  Ghostscript, libheif) n'y apparaissent
+//   - rss_mb     : pic de RSS des process renderer Chromium au-dessus du niveau
+//                  pré-Convert (/proc, Linux) — inclut buffers et heaps WASM ;
+//                  c'est la mesure à confronter aux mem_factor de tools.json
+// Compare à tests/bench-baseline.json : échec si un cas dépasse la baseline de
+// plus de --tolerance (et d'un plancher absolu, pour ignorer le bruit).
+// --update est le seul moyen d'écrire la baseline. Sous CI, une baseline absente
+// ou un cas sans mesure de référence est une erreur (sinon rien n'est comparé).
+//
+// Exit code 0 = dans la tolérance (ou baseline mise à jour), 1 = régression/échec.
+process.env.SITE_DIR = process.env.SITE_DIR || 'dist';
+
+const { chromium } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+const { handle, BASE } = require('./offline');
+
+const FIXTURES = path.join(__dirname, 'fixtures', 'generated');
+const BASELINE = path.join(__dirname, 'bench-baseline.json');
+const MB = 1024 * 1024;
+const CASE_TIMEOUT = 180_000;
+const CI = !!process.env.CI;
+const SAMPLE_MS = 50;
+// Planchers absolus : un écart sous ces seuils n'est jamais une régression
+const MS_FLOOR = 250;
+const HEAP_FLOOR_MB = 8;
+const RSS_FLOOR_MB = 16;
+
+// Familles d'IDs (auditées dans les pages) : A = inp/cbtn/dl, B = fileInput/convertBtn/dlWrap
+const INPUT = '#inp, #fileInput';
+const CONVERT = '#cbtn, #convertBtn';
+const RESULT = '#dl, #dlWrap';
+
+// ─── Matrice outil × fixture(s) ───────────────────────────────────────────────
+// Pas de fixture générée pour MP3/MP4/HEIC/PPTX (aucun encodeur stdlib) :
+// ces outils restent couverts par tests/turboconvert.spec.js.
+// Liste de fixtures = sélection multiple (merge-pdf n'affiche Convert qu'à partir de 2 fichiers).
+const CASES = [
+  ['compress-pdf', 'pdf-1p.pdf'],
+  ['compress-pdf', 'pdf-100p.pdf'],
+  ['merge-pdf',    ['pdf-100p.pdf', 'pdf-1p.pdf']],
+  ['split-pdf',    'pdf-1000p.pdf'],
+  ['rotate-pdf',   'pdf-1000p.pdf'],
+  ['pdf-to-jpg',   'pdf-100p.pdf'],
+  ['pdf-to-word',  'pdf-100p.pdf'],
+  ['pdf-to-excel', 'pdf-100p.pdf'],
+  ['pdf-to-ppt',   'pdf-100p.pdf'],
+  ['jpg-to-pdf',   'jpg-12mp.jpg'],
+  ['word-to-pdf',  'docx-50p.docx'],
+  ['word-to-jpg',  'docx-50p.docx'],
+  ['excel-to-pdf', 'xlsx-10k.xlsx'],
+  ['compress-image', 'jpg-12mp.jpg'],
+  ['compress-image', 'png-12mp.png'],
+  ['png-to-jpg',   'png-12mp.png'],
+  ['jpg-to-png',   'jpg-12mp.jpg'],
+  ['webp-to-jpg',  'webp-12mp.webp'],
+  ['wav-to-mp3',   'wav-1mb.wav'],
+  ['wav-to-mp3',   'wav-10mb.wav'],
+  ['wav-to-mp3',   'wav-100mb.wav'],
+].map(([slug, fixture]) => {
+  const fixtures = [].concat(fixture);
+  return { slug, fixtures, key: `${slug}:${fixtures.join('+')}` };
+});
+
+// ─── Args ─────────────────────────────────────────────────────────────────────
+function parseArgs(argv) {
+  const opts = { update: false, runs: 3, tolerance: 0.25, only: null, json: null };
+  for (let i = 0; i < argv.length; i++) {
+    const a = argv[i];
+    if (a === '--update') opts.update = true;
+    else if (a === '--runs') opts.runs = Number(argv[++i]);
+    else if (a === '--tolerance') opts.tolerance = Number(argv[++i]);
+    else if (a === '--only') opts.only = new Set(argv[++i].split(','));
+    else if (a === '--json') opts.json = argv[++i];
+    else throw new Error(`Argument inconnu : ${a}`);
+  }
+  return opts;
+}
+
+const median = (xs) => {
+  const s = [...xs].sort((a, b) => a - b);
+  const m = s.length >> 1;
+  return s.length % 2 ? s[m] : (s[m - 1] + s[m]) / 2;
+};
+
+// ─── Mesure ───────────────────────────────────────────────────────────────────
+// RSS cumulée des renderers (pids via CDP SystemInfo) ; null hors Linux
+async function rendererRss(browserCdp) {
+  try {
+    const { processInfo } = await browserCdp.send('SystemInfo.getProcessInfo');
+    let total = 0;
+    for (const p of processInfo.filter((p) => p.type === 'renderer')) {
+      const m = /VmRSS:\s+(\d+) kB/.exec(fs.readFileSync(`/proc/${p.id}/status`, 'utf-8'));
+      if (m) total += Number(m[1]) * 1024;
+    }
+    return total;
+  } catch {
+    return null;   // pas de /proc, ou process terminé entre deux lectures
+  }
+}
+
+async function measure(browser, browserCdp, c) {
+  const context = await browser.newContext();
+  await context.route('**/*', handle);
+  const page = await context.newPage();
+  page.on('dialog', (d) => d.dismiss());
+  try {
+    await page.goto(`${BASE}/${c.slug}`, { waitUntil: 'load' });
+    const cdp = await context.newCDPSession(page);
+    await cdp.send('Performance.enable');
+    await page.locator(INPUT).first().setInputFiles(c.fixtures.map((f) => path.join(FIXTURES, f)));
+
+    let peak = 0;
+    const rss0 = await rendererRss(browserCdp);
+    let rssPeak = rss0;
+    let sampling = true;
+    const sampler = (async () => {
+      while (sampling) {
+        try {
+          const { metrics } = await cdp.send('Performance.getMetrics');
+          const heap = metrics.find((m) => m.name === 'JSHeapUsedSize');
+          if (heap && heap.value > peak) peak = heap.value;
+        } catch { /* page en cours de fermeture */ }
+        if (rss0 !== null) {
+          const rss = await rendererRss(browserCdp);
+          if (rss !== null && rss > rssPeak) rssPeak = rss;
+        }
+        await new Promise((r) => setTimeout(r, SAMPLE_MS));
+      }
+    })();
+
+    const t0 = performance.now();
+    await page.locator(CONVERT).first().click({ timeout: CASE_TIMEOUT });
+    await page.locator(RESULT).first().waitFor({ state: 'visible', timeout: CASE_TIMEOUT });
+    const ms = performance.now() - t0;
+    sampling = false;
+    await sampler;
+    return { ms, js_heap_mb: peak / MB, rss_mb: rss0 === null ? null : (rssPeak - rss0) / MB };
+  } finally {
+    await context.close();
+  }
+}
+
+// ─── Comparaison ──────────────────────────────────────────────────────────────
+function regressions(base, cur, tolerance) {
+  const out = [];
+  if (cur.ms > base.ms * (1 + tolerance) && cur.ms - base.ms > MS_FLOOR) {
+    out.push(`time ${Math.round(base.ms)} → ${Math.round(cur.ms)} ms`);
+  }
+  if (cur.js_heap_mb > base.js_heap_mb * (1 + tolerance) && cur.js_heap_mb - base.js_heap_mb > HEAP_FLOOR_MB) {
+    out.push(`JS heap ${base.js_heap_mb.toFixed(1)} → ${cur.js_heap_mb.toFixed(1)} MB`);
+  }
+  if (cur.rss_mb != null && base.rss_mb != null
+      && cur.rss_mb > base.rss_mb * (1 + tolerance) && cur.rss_mb - base.rss_mb > RSS_FLOOR_MB) {
+    out.push(`RSS ${base.rss_mb.toFixed(1)} → ${cur.rss_mb.toFixed(1)} MB`);
+  }
+  return out;
+}
+
+const pct = (cur, base) => `${cur >= base ? '+' : ''}${Math.round((cur / base - 1) * 100)}%`;
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const t0 = Date.now();
+  const fixtureManifest = path.join(FIXTURES, 'manifest.json');
+  if (!fs.existsSync(fixtureManifest)) {
+    console.error(`Fixtures absentes (${FIXTURES}) — lancer : python3 gen-fixtures.py`);
+    return 1;
+  }
+  const fixtures = JSON.parse(fs.readFileSync(fixtureManifest, 'utf-8'));
+  const hasBaseline = fs.existsSync(BASELINE);
+  if (CI && !hasBaseline && !opts.update) {
+    console.error(`Baseline absente (${path.relative(process.cwd(), BASELINE)}) — la mesurer sur le runner CI `
+      + 'avec --update (workflow_dispatch update_baseline) puis la committer.');
+    return 1;
+  }
+  const baseline = hasBaseline
+    ? JSON.parse(fs.readFileSync(BASELINE, 'utf-8'))
+    : { cases: {} };
+
+  const browser = await chromium.launch();
+  const browserCdp = await browser.newBrowserCDPSession();
+  const results = {};
+  let failed = 0;
+  let regressed = 0;
+  let unbaselined = 0;
+
+  console.log(`\n🏁 TurboConvert benchmark — ${opts.runs} run(s)/cas, tolérance ±${Math.round(opts.tolerance * 100)}%`);
+  console.log('='.repeat(60));
+  for (const c of CASES) {
+    if (opts.only && !opts.only.has(c.slug)) continue;
+    if (c.fixtures.some((f) => !fixtures[f])) {
+      console.log(`  - ${c.key} — fixture non générée, ignoré`);
+      continue;
+    }
+    const runs = [];
+    try {
+      for (let i = 0; i < opts.runs; i++) runs.push(await measure(browser, browserCdp, c));
+    } catch (e) {
+      console.log(`  ❌ ${c.key} — ${String(e.message || e).split('\n')[0]}`);
+      results[c.key] = { error: String(e.message || e).split('\n')[0] };
+      failed++;
+      continue;
+    }
+    const cur = {
+      ms: Math.round(median(runs.map((r) => r.ms))),
+      js_heap_mb: Number(median(runs.map((r) => r.js_heap_mb)).toFixed(1)),
+      rss_mb: runs.some((r) => r.rss_mb === null) ? null : Number(median(runs.map((r) => r.rss_mb)).toFixed(1)),
+      fixture_sha256: c.fixtures.map((f) => fixtures[f].sha256).join('+'),
+    };
+    results[c.key] = cur;
+
+    const base = baseline.cases[c.key];
+    const rss = cur.rss_mb === null ? '—' : cur.rss_mb.toFixed(1);
+    let line = `${c.key.padEnd(34)} ${String(cur.ms).padStart(7)} ms  JS ${cur.js_heap_mb.toFixed(1).padStart(6)} MB`
+      + `  RSS ${rss.padStart(7)} MB`;
+    if (!base) {
+      console.log(`  + ${line}  (sans baseline)`);
+      unbaselined++;
+    } else if (base.fixture_sha256 !== cur.fixture_sha256) {
+      console.log(`  ~ ${line}  (fixture modifiée — relancer avec --update)`);
+      unbaselined++;
+    } else {
+      line += `  (${pct(cur.ms, base.ms)} / ${pct(cur.js_heap_mb, base.js_heap_mb)}`
+        + `${cur.rss_mb != null && base.rss_mb ? ' / ' + pct(cur.rss_mb, base.rss_mb) : ''})`;
+      const bad = regressions(base, cur, opts.tolerance);
+      if (bad.length) {
+        console.log(`  ❌ ${line}\n       régression : ${bad.join(', ')}`);
+        regressed++;
+      } else {
+        console.log(`  ✓ ${line}`);
+      }
+    }
+  }
+  await browser.close();
+
+  const measured = Object.values(results).filter((r) => !('error' in r)).length;
+  if (opts.update) {
+    const next = {
+      chromium: browser.version(),
+      runs: opts.runs,
+      cases: { ...baseline.cases, ...Object.fromEntries(
+        Object.entries(results).filter(([, r]) => !('error' in r))) },
+    };
+    fs.writeFileSync(BASELINE, JSON.stringify(next, null, 2) + '\n');
+    console.log(`\nBaseline ${hasBaseline ? 'mise à jour' : 'créée'} : ${path.relative(process.cwd(), BASELINE)}`);
+  }
+  if (opts.json) {
+    fs.writeFileSync(opts.json, JSON.stringify({
+      tolerance: opts.tolerance, runs: opts.runs, regressions: regressed, failures: failed,
+      unbaselined, results,
+    }, null, 2) + '\n');
+  }
+
+  const elapsed = ((Date.now() - t0) / 1000).toFixed(1);
+  console.log('='.repeat(60));
+  if (failed || (regressed && !opts.update)) {
+    console.log(`❌ ${regressed} régression(s), ${failed} échec(s) sur ${measured + failed} cas. (${elapsed}s)`);
+    return 1;
+  }
+  if (unbaselined && !opts.update) {
+    console.log(`${CI ? '❌' : '⚠️ '} ${unbaselined} cas sans baseline comparable — lancer avec --update et committer `
+      + `${path.relative(process.cwd(), BASELINE)}. (${elapsed}s)`);
+    return CI ? 1 : 0;
+  }
+  console.log(`✅ All ${measured} benchmarks within tolerance. (${elapsed}s)`);
+  return 0;
+}
+
+main().then((code) => process.exit(code), (e) => { console.error(e); process.exit(1); });
@@ -0,0 +1,106 @@
+// @ts-check
+// ─── Fixture réseau : miroir CDN local + site servi depuis le disque ──────────
+// Chaque contexte Playwright route :
+//   - cdn.jsdelivr.net        → tests/cdn-mirror/ (rempli une fois par mirror-cdn.py)
+//   - origine BASE_URL        → SITE_DIR (ex. dist/) si défini, avec cleanUrls + headers de vercel.json
+//   - tout le reste (ads, fonts, insights) → bloqué quand SITE_DIR est défini
+// Le miroir est lu, jamais écrit : les workers en parallèle partagent les mêmes
+// fichiers et chaque worker garde les assets déjà lus en mémoire.
+const { test: base, expect } = require('@playwright/test');
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+const BASE = process.env.BASE_URL || 'https://turboconvert.io';
+const MIRROR = path.resolve(ROOT, process.env.CDN_MIRROR || 'tests/cdn-mirror');
+const SITE_DIR = process.env.SITE_DIR ? path.resolve(ROOT, process.env.SITE_DIR) : null;
+const OFFLINE = !!SITE_DIR;
+
+const MIME = {
+  '.html': 'text/html; charset=utf-8', '.js': 'text/javascript; charset=utf-8',
+  '.mjs': 'text/javascript; charset=utf-8', '.css': 'text/css; charset=utf-8',
+  '.json': 'application/json', '.xml': 'application/xml', '.txt': 'text/plain; charset=utf-8',
+  '.svg': 'image/svg+xml', '.png': 'image/png', '.jpg': 'image/jpeg', '.ico': 'image/x-icon',
+  '.wasm': 'application/wasm',
+};
+
+// ─── Miroir CDN ───────────────────────────────────────────────────────────────
+function loadMirrorIndex() {
+  const file = path.join(MIRROR, 'index.json');
+  if (fs.existsSync(file)) return JSON.parse(fs.readFileSync(file, 'utf-8'));
+  if (OFFLINE) throw new Error(`Miroir CDN absent (${file}) — lancer : python3 mirror-cdn.py`);
+  return null;   // run live sans miroir : les assets passent par le réseau
+}
+
+const MIRROR_INDEX = loadMirrorIndex();
+const bodies = new Map();   // cache par worker : url → Buffer
+
+function mirrored(url) {
+  const entry = MIRROR_INDEX && MIRROR_INDEX[url];
+  if (!entry) return null;
+  if (!bodies.has(url)) bodies.set(url, fs.readFileSync(path.join(MIRROR, entry.path)));
+  return { body: bodies.get(url), type: entry.type };
+}
+
+// ─── Site local (équivalent Vercel : cleanUrls + headers) ─────────────────────
+const VERCEL = JSON.parse(fs.readFileSync(path.join(ROOT, 'vercel.json'), 'utf-8'));
+const HEADER_RULES = (VERCEL.headers || []).map((rule) => ({
+  re: new RegExp('^' + rule.source.replace(/:\w+\*/g, '.*').replace(/:\w+/g, '[^/]+') + '$'),
+  headers: Object.fromEntries(rule.headers.map((h) => [h.key.toLowerCase(), h.value])),
+}));
+
+function resolveSite(pathname) {
+  const rel = decodeURIComponent(pathname).replace(/\/+$/, '') || '/index';
+  for (const candidate of [rel, `${rel}.html`, `${rel}/index.html`]) {
+    const file = path.join(SITE_DIR, candidate);
+    if (!file.startsWith(SITE_DIR + path.sep)) return null;
+    if (fs.existsSync(file) && fs.statSync(file).isFile()) return file;
+  }
+  return null;
+}
+
+function siteHeaders(pathname, file) {
+  const headers = { 'content-type': MIME[path.extname(file)] || 'application/octet-stream' };
+  for (const rule of HEADER_RULES) {
+    if (rule.re.test(pathname)) Object.assign(headers, rule.headers);
+  }
+  return headers;
+}
+
+// ─── Handler ──────────────────────────────────────────────────────────────────
+const SITE_ORIGIN = new URL(BASE).origin;
+const CDN_HEADERS = {
+  'access-control-allow-origin': '*',
+  'cross-origin-resource-policy': 'cross-origin',   // pages FFmpeg en COEP require-corp
+  'cache-control': 'public, max-age=31536000, immutable',
+};
+
+async function handle(route) {
+  const url = new URL(route.request().url());
+  const hit = mirrored(url.href);
+  if (hit) {
+    return route.fulfill({ status: 200, body: hit.body, headers: { ...CDN_HEADERS, 'content-type': hit.type } });
+  }
+  if (OFFLINE && url.origin === SITE_ORIGIN) {
+    const file = resolveSite(url.pathname);
+    if (!file) return route.fulfill({ status: 404, body: 'Not found' });
+    return route.fulfill({ status: 200, body: fs.readFileSync(file), headers: siteHeaders(url.pathname, file) });
+  }
+  if (OFFLINE) {
+    if (url.hostname === 'cdn.jsdelivr.net') {
+      return route.fulfill({ status: 404, body: `${url.href} absent du miroir — relancer mirror-cdn.py` });
+    }
+    return route.abort('blockedbyclient');
+  }
+  return route.continue();
+}
+
+const test = base.extend({
+  context: async ({ context }, use) => {
+    await context.route('**/*', handle);
+    await use(context);
+  },
+});
+
+// handle est aussi branché hors test runner (tests/bench.js)
+module.exports = { test, expect, handle, BASE, OFFLINE };
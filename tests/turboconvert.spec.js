@@ -1,10 +1,12 @@
 // @ts-check
-const { test, expect } = require('@playwright/test');
 const path = require('path');
+// Assets CDN servis depuis tests/cdn-mirror/, site depuis SITE_DIR (voir offline.js)
+const { test, expect, BASE } = require('./offline');
 
 // ─── Config ───────────────────────────────────────────────────────────────────
-const BASE = process.env.BASE_URL || 'https://turboconvert.io';
 const F = (name) => path.join(__dirname, 'fixtures', name);
+// Manifeste des outils (routage du detector, moteurs préchauffés)
+const MANIFEST = require('../tools.json');
 
 // Timeout généreux pour les conversions (FFmpeg peut prendre du temps)
 const CONVERT_TIMEOUT = 60_000;
@@ -17,6 +19,15 @@ async function uploadAndConvert(page, fixture, waitFor = 'dlWrap') {
   await expect(page.locator(`#${waitFor}`)).toBeVisible({ timeout: CONVERT_TIMEOUT });
 }
 
+// Appareil à `gb` Go : budget TCMem = gb × 0.4 Go exactement (heap vu vide, pas de mesure UA)
+async function lowMemory(page, gb) {
+  await page.addInitScript((gb) => {
+    Object.defineProperty(Navigator.prototype, 'deviceMemory', { get: () => gb, configurable: true });
+    Object.defineProperty(performance, 'memory', { get: () => ({ usedJSHeapSize: 0 }), configurable: true });
+    Object.defineProperty(Performance.prototype, 'measureUserAgentSpecificMemory', { value: undefined, configurable: true });
+  }, gb);
+}
+
 // ─── SUITE 1 : Homepage ───────────────────────────────────────────────────────
 test.describe('Homepage', () => {
   test('se charge correctement', async ({ page }) => {
@@ -53,6 +64,23 @@ test.describe('Homepage', () => {
     expect(hasFile).toBe(true);
   });
 
+  test('detector préchauffe le premier outil suggéré (speculationrules/prefetch + moteurs)', async ({ page }) => {
+    const slug = MANIFEST.detector.pdf[0];
+    const tool = MANIFEST.tools.find((t) => t.slug === slug);
+    await page.goto(BASE);
+    await page.locator('#detectorInput').setInputFiles(F('test.pdf'));
+    await expect(page.locator('#detectorResults')).toBeVisible({ timeout: 3000 });
+    const hints = await page.evaluate(() => ({
+      rules: [...document.querySelectorAll('script[type="speculationrules"]')].map((s) => JSON.parse(s.textContent)),
+      prefetch: [...document.querySelectorAll('link[rel="prefetch"]')].map((l) => l.getAttribute('href')),
+    }));
+    const speculated = hints.rules.some((r) => (r.prefetch || []).some((p) => (p.urls || []).includes(`/${slug}`)));
+    expect(speculated || hints.prefetch.includes(`/${slug}`)).toBe(true);
+    for (const engine of tool.engines) {
+      for (const url of MANIFEST.engines[engine]) expect(hints.prefetch).toContain(url);
+    }
+  });
+
   test('clic sur un outil depuis le detector redirige correctement', async ({ page }) => {
     await page.goto(BASE);
     await page.locator('#detectorInput').setInputFiles(F('test.pdf'));
@@ -319,3 +347,76 @@ test.describe('Blog & SEO', () => {
     });
   }
 });
+
+// ─── SUITE 10 : Gouverneur mémoire / annulation ──────────────────────────────
+test.describe('Gouverneur mémoire (TCMem)', () => {
+  test('wav-to-mp3 : Cancel pendant FFmpeg → UI réinitialisée sans erreur, conversion suivante OK', async ({ page }) => {
+    const dialogs = [];
+    page.on('dialog', (d) => { dialogs.push(d.message()); d.dismiss(); });
+    // Core WASM retenu jusqu'au Cancel : l'annulation tombe pendant ffmpeg.load(), sans course
+    let release;
+    const held = new Promise((r) => { release = r; });
+    await page.route('**/ffmpeg-core.wasm', async (route) => { await held; await route.fallback(); });
+
+    await page.goto(`${BASE}/wav-to-mp3`);
+    await page.locator('#inp').setInputFiles(F('test.wav'));
+    await expect(page.locator('#frow')).toBeVisible({ timeout: 5000 });
+    await page.locator('#cbtn').click();
+    await page.locator('.tc-cancel').click();
+    release();
+
+    await expect(page.locator('#prog')).toBeHidden();
+    await expect(page.locator('#err')).toBeHidden();
+    await expect(page.locator('#cbtn')).toBeEnabled();
+
+    // ffmpeg.exit() a tué le core : il est rechargé au clic suivant
+    await page.unroute('**/ffmpeg-core.wasm');
+    await page.locator('#cbtn').click();
+    await expect(page.locator('#dl')).toBeVisible({ timeout: CONVERT_TIMEOUT });
+    await expect(page.locator('#err')).toBeHidden();
+    expect(dialogs).toEqual([]);
+  });
+
+  test('mp3-to-wav : mémoire insuffisante → erreur lisible au lieu d\'un crash', async ({ page }) => {
+    // 0.125 Go → budget ~51 MB < heap du core FFmpeg (96 MB) : refus avant tout chargement
+    await lowMemory(page, 0.125);
+    const core = [];
+    page.on('request', (r) => { if (r.url().includes('ffmpeg-core')) core.push(r.url()); });
+
+    await page.goto(`${BASE}/mp3-to-wav`);
+    await page.locator('#inp').setInputFiles(F('test.mp3'));
+    await expect(page.locator('#frow')).toBeVisible({ timeout: 5000 });
+    await page.locator('#cbtn').click();
+    await expect(page.locator('#err')).toBeVisible();
+    await expect(page.locator('#err')).toContainText('Not enough memory');
+    await expect(page.locator('#cbtn')).toBeEnabled();
+    expect(core).toEqual([]);
+  });
+
+  test('wav-to-mp3 : budget serré → stratégie chunked (segments wavLayout)', async ({ page }) => {
+    // 0.5 Go → budget 204.8 MB : 40 MB de WAV (96 + 3 × 40 MB) ne tient pas, un segment de 60 s si
+    await lowMemory(page, 0.5);
+    await page.goto(`${BASE}/wav-to-mp3`);
+    const res = await page.evaluate(async () => {
+      const dataBytes = 40 * 1048576;
+      const h = new DataView(new ArrayBuffer(44));
+      const tag = (p, t) => { for (let i = 0; i < 4; i++) h.setUint8(p + i, t.charCodeAt(i)); };
+      tag(0, 'RIFF'); h.setUint32(4, 36 + dataBytes, true); tag(8, 'WAVE');
+      tag(12, 'fmt '); h.setUint32(16, 16, true); h.setUint16(20, 1, true); h.setUint16(22, 1, true);
+      h.setUint32(24, 8000, true); h.setUint32(28, 16000, true); h.setUint16(32, 2, true); h.setUint16(34, 16, true);
+      tag(36, 'data'); h.setUint32(40, dataBytes, true);
+      const f = new File([h.buffer, new Uint8Array(dataBytes)], 'long.wav', { type: 'audio/wav' });
+
+      const layout = await wavLayout(f);
+      const job = await TCMem.start(f, { chunkBytes: layout.segBytes });
+      const strategy = job.strategy;
+      job.end();
+      // Sans découpage possible, la même entrée est refusée proprement
+      const whole = await TCMem.start(f).then(() => 'started', (e) => e.name);
+      return { segBytes: layout.segBytes, strategy, whole };
+    });
+    expect(res.segBytes).toBe(16000 * 60);
+    expect(res.strategy).toBe('chunked');
+    expect(res.whole).toBe('TCMemoryError');
+  });
+});